@@ -0,0 +1,430 @@
+import argparse
+import concurrent.futures
+import datetime
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Benchmark settings
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_OPS = 200
+DEFAULT_BUDGET_SECONDS = 30.0
+LOAD_REPEATS = 3
+CODEC_REPEATS = 3
+RESULTS_FILE = 'bench_results.json'
+
+# Total bytes this process has passed to write() so far, or None where the OS
+# does not expose it
+def bytes_written():
+    try:
+        with open('/proc/self/io', 'r') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+# Runs op(i) up to count times, timing each call, and stops early once the phase
+# has used up its time budget
+def measure(phase, op, count, budget, track_memory):
+    latencies = []
+    errors = 0
+    truncated = False
+    if track_memory:
+        tracemalloc.start()
+    written_before = bytes_written()
+    start = time.perf_counter()
+    for i in range(count):
+        op_start = time.perf_counter()
+        try:
+            op(i)
+        except ValueError:
+            errors += 1
+        now = time.perf_counter()
+        latencies.append(now - op_start)
+        if now - start > budget:
+            truncated = i + 1 < count
+            break
+    elapsed = time.perf_counter() - start
+    written_after = bytes_written()
+    peak_memory = None
+    if track_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    latencies.sort()
+    return {
+        "phase": phase,
+        "ops": len(latencies),
+        "errors": errors,
+        "truncated": truncated,
+        "seconds": elapsed,
+        "ops_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "bytes_written": None if written_before is None else written_after - written_before,
+        "peak_memory_bytes": peak_memory,
+    }
+
+# Scenarios: generate() writes a synthetic data set of n records straight to the
+# system's storage, open() starts the system on it, and add/link/get drive the
+# public methods on top of that data set.
+class CollegeScenario:
+    module_name = 'College'
+
+    def generate(self, module, n, rng):
+        professors = max(1, n // 50)
+        courses = max(1, n // 20)
+        data = {
+            "students": [module.Student(f"Student {i}", 18 + i % 10, i).to_dict() for i in range(1, n + 1)],
+            "professors": [module.Professor(f"Professor {i}", f"Dept {i % 20}", i).to_dict() for i in range(1, professors + 1)],
+            "courses": [],
+        }
+        for i in range(1, courses + 1):
+            course = module.Course(f"Course {i}", rng.randint(1, professors))
+            course.students = module.Enrollment(rng.randint(1, n) for _ in range(20))
+            data["courses"].append(course.to_dict())
+        module.save_data(data)
+        self.n, self.professors, self.courses = n, professors, courses
+
+    def open(self, module):
+        return module.CollegeManagementSystem()
+
+    def add(self, system, i, rng):
+        system.add_student(f"New Student {i}", 20)
+
+    def link(self, system, i, rng):
+        system.assign_student_to_course(rng.randint(1, self.n), f"Course {rng.randint(1, self.courses)}")
+
+    def get(self, system, i, rng):
+        system.get_student_info(rng.randint(1, self.n))
+        system.get_course_info(f"Course {rng.randint(1, self.courses)}")
+
+class SchoolScenario:
+    module_name = 'School'
+
+    def generate(self, module, n, rng):
+        teachers = max(1, n // 50)
+        classes = max(1, n // 20)
+        data = {
+            "students": [module.Student(f"Student {i}", 6 + i % 12, i).to_dict() for i in range(1, n + 1)],
+            "teachers": [module.Teacher(f"Teacher {i}", f"Subject {i % 15}", i).to_dict() for i in range(1, teachers + 1)],
+            "classes": [],
+        }
+        for i in range(1, classes + 1):
+            school_class = module.SchoolClass(f"Class {i}", rng.randint(1, teachers))
+            for _ in range(20):
+                school_class.add_student(rng.randint(1, n))
+            data["classes"].append(school_class.to_dict())
+        module.save_data(data)
+        self.n, self.classes = n, classes
+
+    def open(self, module):
+        # The same configuration the interactive program uses
+        return module.SchoolManagementSystem(shared=True)
+
+    def add(self, system, i, rng):
+        system.add_student(f"New Student {i}", 10)
+
+    def link(self, system, i, rng):
+        system.assign_student_to_class(rng.randint(1, self.n), f"Class {rng.randint(1, self.classes)}")
+
+    def get(self, system, i, rng):
+        system.get_student_info(rng.randint(1, self.n))
+        system.get_class_info(f"Class {rng.randint(1, self.classes)}")
+
+class HotelScenario:
+    module_name = 'Hotel'
+    first_day = datetime.date(2000, 1, 1)
+
+    def generate(self, module, n, rng):
+        rooms = max(10, n // 100)
+        data = {
+            "rooms": [module.Room(str(100 + i), ('single', 'double', 'suite')[i % 3], 50.0 + i % 200).to_dict() for i in range(rooms)],
+            "guests": [module.Guest(f"Guest {i}", 20 + i % 60, i).to_dict() for i in range(1, n + 1)],
+            "reservations": [],
+        }
+        # Back-to-back two-night stays per room, so the generated history never overlaps
+        for i in range(1, n + 1):
+            room = (i - 1) % rooms
+            check_in = self.first_day + datetime.timedelta(days=2 * ((i - 1) // rooms))
+            check_out = check_in + datetime.timedelta(days=2)
+            data["reservations"].append(module.Reservation(
+                i, str(100 + room), rng.randint(1, n), check_in.isoformat(), check_out.isoformat()).to_dict())
+        module.save_data(data)
+        # Opening lazily once splits the history into monthly segments
+        module.HotelManagementSystem(lazy=True)
+        self.n, self.rooms = n, rooms
+        self.next_day = self.first_day + datetime.timedelta(days=2 * (n // rooms + 1))
+
+    def open(self, module):
+        # The same configuration the interactive program uses
+        return module.HotelManagementSystem(lazy=True)
+
+    def add(self, system, i, rng):
+        system.add_guest(f"New Guest {i}", 30)
+
+    def link(self, system, i, rng):
+        check_in = self.next_day + datetime.timedelta(days=2 * (i // self.rooms))
+        check_out = check_in + datetime.timedelta(days=2)
+        system.create_reservation(str(100 + i % self.rooms), rng.randint(1, self.n), check_in.isoformat(), check_out.isoformat())
+
+    def get(self, system, i, rng):
+        system.get_reservation_info(rng.randint(1, self.n))
+
+class LibraryScenario:
+    module_name = 'Library'
+
+    def generate(self, module, n, rng):
+        members = max(1, n // 10)
+        data = {
+            "books": [module.Book(f"Title {i} Volume {i % 7}", f"Author {i % 1000}", str(9780000000000 + i), i).to_dict() for i in range(1, n + 1)],
+            "members": [module.Member(f"Member {i}", i).to_dict() for i in range(1, members + 1)],
+            "transactions": [],
+        }
+        for i in range(1, n + 1):
+            borrowed = datetime.date(2000, 1, 1) + datetime.timedelta(days=i // 100)
+            returned = (borrowed + datetime.timedelta(days=14)).isoformat() if i % 10 else None
+            data["transactions"].append(module.Transaction(
+                i, rng.randint(1, n), rng.randint(1, members), borrowed.isoformat(), returned).to_dict())
+        module.save_data(data)
+        self.n, self.members = n, members
+
+    def open(self, module):
+        # The same configuration the interactive program uses
+        return module.LibraryManagementSystem(journaled=True)
+
+    def add(self, system, i, rng):
+        system.add_book(f"New Title {i}", "New Author", str(9790000000000 + i))
+
+    def link(self, system, i, rng):
+        system.borrow_book(rng.randint(1, self.n), rng.randint(1, self.members), '2030-01-01')
+
+    def get(self, system, i, rng):
+        system.get_transaction_info(rng.randint(1, self.n))
+
+class HospitalScenario:
+    module_name = 'Hospital'
+
+    def generate(self, module, n, rng):
+        hospital = module.Hospital(persistent=False)
+        doctors = max(1, n // 100)
+        for i in range(doctors):
+            hospital.register_doctor(f"Doctor {i}", f"Specialization {i % 12}", str(i))
+        for i in range(n):
+            hospital.register_patient(f"Patient {i}", i % 90, 'F' if i % 2 else 'M', str(5550000 + i))
+        day = datetime.date(2020, 1, 1).toordinal()
+        for i in range(n):
+            patient = hospital.patients[rng.randrange(n)]
+            doctor = hospital.doctors[i % doctors]
+            hospital.place(patient, doctor, day + i // (doctors * module.SLOTS_PER_DAY))
+        hospital.persistent = True
+        hospital.checkpoint()
+        self.n, self.doctors = n, doctors
+
+    def open(self, module):
+        return module.Hospital()
+
+    def add(self, system, i, rng):
+        system.register_patient(f"New Patient {i}", 40, 'F', '5551234')
+
+    def link(self, system, i, rng):
+        system.book_appointment(rng.randint(1, self.n), rng.randint(1, self.doctors), '2030-01-02')
+
+    def get(self, system, i, rng):
+        system.find_patient_by_id(rng.randint(1, self.n))
+
+SCENARIOS = {
+    'college': CollegeScenario,
+    'school': SchoolScenario,
+    'hotel': HotelScenario,
+    'library': LibraryScenario,
+    'hospital': HospitalScenario,
+}
+
+# Runs one system at one size inside a fresh temporary directory. Meant to be run
+# in its own process so module-level state and peak RSS start clean.
+def run_case(system_name, size, ops, budget, track_memory, seed):
+    sys.path.insert(0, REPO_DIR)
+    scenario = SCENARIOS[system_name]()
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix=f'bench_{system_name}_') as workdir:
+        os.chdir(workdir)
+        module = importlib.import_module(scenario.module_name)
+        generate_start = time.perf_counter()
+        scenario.generate(module, size, rng)
+        generate_seconds = time.perf_counter() - generate_start
+        phases = [measure('load', lambda i: scenario.open(module), LOAD_REPEATS, budget, track_memory)]
+        system = scenario.open(module)
+        for phase in ('get', 'add', 'link'):
+            op = getattr(scenario, phase)
+            phases.append(measure(phase, lambda i: op(system, i, rng), ops, budget, track_memory))
+        data_bytes = sum(os.path.getsize(os.path.join(root, name))
+                         for root, _, names in os.walk(workdir) for name in names)
+        os.chdir(REPO_DIR)
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    for result in phases:
+        result.update(system=system_name, size=size)
+    return {
+        "system": system_name,
+        "size": size,
+        "generate_seconds": generate_seconds,
+        "data_bytes": data_bytes,
+        "peak_rss_kb": peak_rss_kb,
+        "phases": phases,
+    }
+
+# Saves and loads one generated Library data set with every available codec
+def run_codec_case(size, budget, seed):
+    sys.path.insert(0, REPO_DIR)
+    rng = random.Random(seed)
+    results = []
+    with tempfile.TemporaryDirectory(prefix='bench_codecs_') as workdir:
+        os.chdir(workdir)
+        module = importlib.import_module('Library')
+        LibraryScenario().generate(module, size, rng)
+        data = module.load_data()
+        for name in module.CODECS:
+            path = f'library_data.{name}'
+            save = measure('save', lambda i: module.save_data(data, name, path), CODEC_REPEATS, budget, False)
+            load = measure('load', lambda i: module.load_data(path), CODEC_REPEATS, budget, False)
+            results.append({
+                "codec": name,
+                "size": size,
+                "file_bytes": os.path.getsize(path),
+                "save_ms": save['p50_ms'],
+                "load_ms": load['p50_ms'],
+            })
+        os.chdir(REPO_DIR)
+    return results
+
+def run_codecs(sizes, budget, seed):
+    results = {"meta": run_metadata(None, budget), "codecs": []}
+    context = multiprocessing.get_context('spawn')
+    print(f"{'size':>9}  {'codec':<9}{'file bytes':>14}{'save ms':>11}{'load ms':>11}{'save x':>8}{'load x':>8}")
+    for size in sizes:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            cases = pool.submit(run_codec_case, size, budget, seed).result()
+        # Speedups are relative to the pretty-printed JSON the data file used to be
+        baseline = next(case for case in cases if case['codec'] == 'pretty')
+        for case in cases:
+            print(f"{size:>9}  {case['codec']:<9}{case['file_bytes']:>14}{case['save_ms']:>11.2f}{case['load_ms']:>11.2f}"
+                  f"{baseline['save_ms'] / case['save_ms']:>7.2f}x{baseline['load_ms'] / case['load_ms']:>7.2f}x")
+        results["codecs"].extend(cases)
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_metadata(ops, budget):
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now().isoformat(timespec='seconds'),
+        "ops": ops,
+        "budget_seconds": budget,
+    }
+
+def run_suite(systems, sizes, ops, budget, track_memory, seed):
+    results = {"meta": run_metadata(ops, budget), "cases": []}
+    context = multiprocessing.get_context('spawn')
+    for system_name in systems:
+        for size in sizes:
+            print(f"{system_name} @ {size} records...", flush=True)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                case = pool.submit(run_case, system_name, size, ops, budget, track_memory, seed).result()
+            results["cases"].append(case)
+            for result in case["phases"]:
+                print(format_result(result))
+    return results
+
+def format_result(result):
+    written = result["bytes_written"]
+    return (f"  {result['phase']:<5} {result['ops']:>7} ops  {result['ops_per_sec']:>10.1f} ops/s  "
+            f"p50 {result['p50_ms']:8.3f}ms  p95 {result['p95_ms']:8.3f}ms  p99 {result['p99_ms']:8.3f}ms  "
+            f"written {'n/a' if written is None else written:>12}"
+            f"{'  (budget exhausted)' if result['truncated'] else ''}")
+
+def compare(baseline_path, current_path):
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    with open(current_path, 'r') as f:
+        current = json.load(f)
+    previous = {(p['system'], p['size'], p['phase']): p for case in baseline['cases'] for p in case['phases']}
+    print(f"{'system':<10}{'size':>9}  {'phase':<6}{'baseline ops/s':>16}{'current ops/s':>16}{'speedup':>10}")
+    for case in current['cases']:
+        for result in case['phases']:
+            before = previous.get((result['system'], result['size'], result['phase']))
+            if not before or not before['ops_per_sec']:
+                continue
+            speedup = result['ops_per_sec'] / before['ops_per_sec']
+            print(f"{result['system']:<10}{result['size']:>9}  {result['phase']:<6}"
+                  f"{before['ops_per_sec']:>16.1f}{result['ops_per_sec']:>16.1f}{speedup:>9.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the management systems.")
+    parser.add_argument('--systems', default=','.join(SCENARIOS),
+                        help="comma-separated systems to run (default: all)")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated data set sizes, e.g. 1000,10000,100000,1000000")
+    parser.add_argument('--ops', type=int, default=DEFAULT_OPS, help="operations per phase")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="seconds after which a phase stops early")
+    parser.add_argument('--memory', action='store_true',
+                        help="track peak Python memory per phase (slows every phase down)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default=RESULTS_FILE, help="where to write the JSON results")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="compare two result files instead of running")
+    parser.add_argument('--codecs', action='store_true',
+                        help="benchmark the Library data file codecs at each size instead of running the systems")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    systems = [name.strip() for name in args.systems.split(',') if name.strip()]
+    unknown = [name for name in systems if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown systems: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(',')]
+    if args.codecs:
+        results = run_codecs(sizes, args.budget, args.seed)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+        print(f"Results written to {args.output}")
+        return
+    results = run_suite(systems, sizes, args.ops, args.budget, args.memory, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,34 @@
+import base64
+import concurrent.futures
 import json
 import os
+import queue
+import random
+import sqlite3
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
 
 # Data Storage
 DATA_FILE = 'college_data.json'
+DB_FILE = 'college_data.db'
+POOL_SIZE = 4
+
+# Timetable: the teaching week is a grid of DAYS x PERIODS_PER_DAY meeting slots,
+# numbered day by day from 0
+DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')
+PERIODS_PER_DAY = 8
+WEEK_SLOTS = len(DAYS) * PERIODS_PER_DAY
+MEETINGS_PER_WEEK = 2
+PROFESSOR_CLASH_WEIGHT = 1000
+SOLVER_RESTARTS = 4
+SOLVER_ROUNDS = 20
+# Below these sizes starting worker processes costs more than it saves
+PARALLEL_MIN_CHUNK = 5000
+PARALLEL_MIN_COURSES = 200
 
 # Initialize data storage if it does not exist
 if not os.path.exists(DATA_FILE):
@@ -46,29 +72,251 @@ class Professor:
     def from_dict(data):
         return Professor(data['name'], data['department'], data['professor_id'])
 
+# Enrollment: a sorted, duplicate-free array of student IDs. On disk it is stored
+# as base64 of the varint-encoded gaps between consecutive IDs.
+class Enrollment:
+    def __init__(self, student_ids=()):
+        self.ids = array('I', sorted(set(student_ids)))
+
+    def add(self, student_id):
+        i = bisect_left(self.ids, student_id)
+        if i < len(self.ids) and self.ids[i] == student_id:
+            return False
+        self.ids.insert(i, student_id)
+        return True
+
+    def __contains__(self, student_id):
+        i = bisect_left(self.ids, student_id)
+        return i < len(self.ids) and self.ids[i] == student_id
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def intersection(self, other):
+        return Enrollment(set(self.ids).intersection(other.ids))
+
+    def union(self, other):
+        return Enrollment(set(self.ids).union(other.ids))
+
+    def encode(self):
+        out = bytearray()
+        previous = 0
+        for student_id in self.ids:
+            gap = student_id - previous
+            previous = student_id
+            while gap >= 0x80:
+                out.append(gap & 0x7F | 0x80)
+                gap >>= 7
+            out.append(gap)
+        return base64.b64encode(bytes(out)).decode('ascii')
+
+    @staticmethod
+    def decode(data):
+        # Older data files store a plain list of student IDs
+        if isinstance(data, list):
+            return Enrollment(data)
+        enrollment = Enrollment()
+        ids = enrollment.ids
+        current = 0
+        gap = 0
+        shift = 0
+        for byte in base64.b64decode(data):
+            gap |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+            else:
+                current += gap
+                ids.append(current)
+                gap = 0
+                shift = 0
+        return enrollment
+
 # Course management
 class Course:
-    def __init__(self, course_name, professor_id):
+    def __init__(self, course_name, professor_id, slots=0):
         self.course_name = course_name
         self.professor_id = professor_id
-        self.students = []
+        self.students = Enrollment()
+        # Bitset of the weekly meeting slots; bit n is slot n
+        self.slots = slots
 
     def add_student(self, student_id):
-        self.students.append(student_id)
+        return self.students.add(student_id)
 
     def to_dict(self):
         return {
             "course_name": self.course_name,
             "professor_id": self.professor_id,
-            "students": self.students
+            "students": self.students.encode(),
+            "slots": list(iter_bits(self.slots))
         }
 
     @staticmethod
     def from_dict(data):
-        course = Course(data['course_name'], data['professor_id'])
-        course.students = data['students']
+        course = Course(data['course_name'], data['professor_id'], slots_to_mask(data.get('slots', [])))
+        course.students = Enrollment.decode(data['students'])
         return course
 
+# Timetable engine. Slots are given as numbers or labels like "Mon 3" (day and
+# period from 1). Courses are numbered by position; each course's slots and each
+# student's or professor's courses are int bitsets, so a clash is a non-zero AND.
+def parse_slot(slot):
+    if isinstance(slot, str):
+        fields = slot.split()
+        if len(fields) != 2 or fields[0].title() not in DAYS or not fields[1].isdigit():
+            raise ValueError(f"Slots look like 'Mon 3', got {slot!r}")
+        day, period = DAYS.index(fields[0].title()), int(fields[1]) - 1
+        if not 0 <= period < PERIODS_PER_DAY:
+            raise ValueError(f"Periods run from 1 to {PERIODS_PER_DAY}, got {slot!r}")
+        return day * PERIODS_PER_DAY + period
+    if not isinstance(slot, int) or not 0 <= slot < WEEK_SLOTS:
+        raise ValueError(f"Slot numbers run from 0 to {WEEK_SLOTS - 1}, got {slot!r}")
+    return slot
+
+def slot_label(slot):
+    return f"{DAYS[slot // PERIODS_PER_DAY]} {slot % PERIODS_PER_DAY + 1}"
+
+def slots_to_mask(slots):
+    mask = 0
+    for slot in slots:
+        mask |= 1 << parse_slot(slot)
+    return mask
+
+def iter_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def chunked(items, workers):
+    size = max(PARALLEL_MIN_CHUNK, -(-len(items) // workers))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def run_parallel(function, tasks, workers):
+    # Runs function(*task) for every task, across a process pool when there is
+    # more than one task and more than one worker
+    if workers <= 1 or len(tasks) <= 1:
+        return [function(*task) for task in tasks]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(function, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+# Worker functions are module level so the process pool can pickle them
+def find_clashes_chunk(members, course_masks):
+    # members are (kind, member_id, course bitset); returns a
+    # (kind, member_id, course, other course, overlapping slots) tuple per clash
+    clashes = []
+    for kind, member_id, courses in members:
+        busy = 0
+        seen = []
+        for course in iter_bits(courses):
+            mask = course_masks[course]
+            if busy & mask:
+                for other in seen:
+                    if course_masks[other] & mask:
+                        clashes.append((kind, member_id, other, course, course_masks[other] & mask))
+            busy |= mask
+            seen.append(course)
+    return clashes
+
+def count_shared_chunk(course_lists):
+    # Number of students shared by every pair of courses taken together
+    shared = Counter()
+    for courses in course_lists:
+        for i, course in enumerate(courses):
+            for other in courses[i + 1:]:
+                shared[course, other] += 1
+    return shared
+
+def solve_timetable_chunk(neighbours, meetings, seed, rounds):
+    # Greedy placement, most constrained course first, then rounds of moving single
+    # courses to their cheapest slots until no move helps. The cost of a pair of
+    # courses is their edge weight times the number of slots they share.
+    rng = random.Random(seed)
+    masks = [0] * len(meetings)
+
+    def slot_costs(course):
+        costs = [0] * WEEK_SLOTS
+        for other, weight in neighbours[course]:
+            for slot in iter_bits(masks[other]):
+                costs[slot] += weight
+        return costs
+
+    def cheapest(course, costs):
+        # Ties go to days the course does not meet on yet, then at random
+        mask = 0
+        days = set()
+        for _ in range(meetings[course]):
+            slot = min((s for s in range(WEEK_SLOTS) if not mask >> s & 1),
+                       key=lambda s: (costs[s], s // PERIODS_PER_DAY in days, rng.random()))
+            mask |= 1 << slot
+            days.add(slot // PERIODS_PER_DAY)
+        return mask
+
+    def mask_cost(mask, costs):
+        return sum(costs[slot] for slot in iter_bits(mask))
+
+    order = sorted(range(len(meetings)), key=lambda c: (-sum(w for _, w in neighbours[c]), rng.random()))
+    for course in order:
+        masks[course] = cheapest(course, slot_costs(course))
+    for _ in range(rounds):
+        moved = False
+        rng.shuffle(order)
+        for course in order:
+            costs = slot_costs(course)
+            mask = cheapest(course, costs)
+            if mask_cost(mask, costs) < mask_cost(masks[course], costs):
+                masks[course] = mask
+                moved = True
+        if not moved:
+            break
+    cost = sum(weight * bin(masks[course] & masks[other]).count('1')
+               for course in range(len(meetings)) for other, weight in neighbours[course] if course < other)
+    return cost, masks
+
+def detect_clashes(professor_ids, course_masks, enrollments, workers):
+    members = {}
+    for course, student_ids in enumerate(enrollments):
+        for student_id in student_ids:
+            key = ('student', student_id)
+            members[key] = members.get(key, 0) | 1 << course
+    for course, professor_id in enumerate(professor_ids):
+        key = ('professor', professor_id)
+        members[key] = members.get(key, 0) | 1 << course
+    # Only members with two or more courses can clash
+    busy = [(kind, member_id, courses) for (kind, member_id), courses in members.items() if courses & (courses - 1)]
+    clashes = []
+    for part in run_parallel(find_clashes_chunk, [(chunk, course_masks) for chunk in chunked(busy, workers)], workers):
+        clashes.extend(part)
+    return clashes
+
+def conflict_graph(professor_ids, enrollments, workers):
+    # neighbours[course] lists (other course, weight): the number of students the
+    # two share, plus PROFESSOR_CLASH_WEIGHT when they have the same professor
+    courses_by_member = {}
+    for course, student_ids in enumerate(enrollments):
+        for student_id in student_ids:
+            courses_by_member.setdefault(student_id, []).append(course)
+    course_lists = [courses for courses in courses_by_member.values() if len(courses) > 1]
+    weights = Counter()
+    for part in run_parallel(count_shared_chunk, [(chunk,) for chunk in chunked(course_lists, workers)], workers):
+        weights.update(part)
+    courses_by_professor = {}
+    for course, professor_id in enumerate(professor_ids):
+        courses_by_professor.setdefault(professor_id, []).append(course)
+    for courses in courses_by_professor.values():
+        for i, course in enumerate(courses):
+            for other in courses[i + 1:]:
+                weights[course, other] += PROFESSOR_CLASH_WEIGHT
+    neighbours = [[] for _ in professor_ids]
+    for (course, other), weight in weights.items():
+        neighbours[course].append((other, weight))
+        neighbours[other].append((course, weight))
+    return neighbours
+
 # Main College Management System
 class CollegeManagementSystem:
     def __init__(self):
@@ -76,6 +324,20 @@ class CollegeManagementSystem:
         self.students = [Student.from_dict(s) for s in self.data['students']]
         self.professors = [Professor.from_dict(p) for p in self.data['professors']]
         self.courses = [Course.from_dict(c) for c in self.data['courses']]
+        self.students_by_id = {s.student_id: s for s in self.students}
+        self.courses_by_name = {}
+        for course in self.courses:
+            self.courses_by_name.setdefault(course.course_name, course)
+        # Materialized rosters: course name -> list of student dicts, built on first
+        # use and then kept current by assign_student_to_course
+        self.rosters = {}
+
+    # Courses as parallel lists of names, professor IDs, slot bitsets and
+    # enrollments, in the order the timetable engine numbers them
+    def timetable_inputs(self):
+        courses = list(self.courses_by_name.values())
+        return ([c.course_name for c in courses], [c.professor_id for c in courses],
+                [c.slots for c in courses], [c.students for c in courses])
 
     def save(self):
         self.data['students'] = [s.to_dict() for s in self.students]
@@ -87,6 +349,7 @@ class CollegeManagementSystem:
         student_id = len(self.students) + 1
         student = Student(name, age, student_id)
         self.students.append(student)
+        self.students_by_id[student_id] = student
         self.save()
         return student
 
@@ -102,20 +365,26 @@ class CollegeManagementSystem:
             raise ValueError("Professor ID does not exist")
         course = Course(course_name, professor_id)
         self.courses.append(course)
+        self.courses_by_name.setdefault(course_name, course)
         self.save()
         return course
 
     def assign_student_to_course(self, student_id, course_name):
-        if not any(s.student_id == student_id for s in self.students):
+        student = self.students_by_id.get(student_id)
+        if not student:
             raise ValueError("Student ID does not exist")
-        course = next((c for c in self.courses if c.course_name == course_name), None)
+        course = self.courses_by_name.get(course_name)
         if not course:
             raise ValueError("Course does not exist")
-        course.add_student(student_id)
+        if not course.add_student(student_id):
+            raise ValueError("Student is already enrolled in this course")
+        roster = self.rosters.get(course_name)
+        if roster is not None:
+            roster.append(student.to_dict())
         self.save()
 
     def get_student_info(self, student_id):
-        student = next((s for s in self.students if s.student_id == student_id), None)
+        student = self.students_by_id.get(student_id)
         if not student:
             raise ValueError("Student not found")
         return student.to_dict()
@@ -127,13 +396,387 @@ class CollegeManagementSystem:
         return professor.to_dict()
 
     def get_course_info(self, course_name):
-        course = next((c for c in self.courses if c.course_name == course_name), None)
+        course = self.courses_by_name.get(course_name)
         if not course:
             raise ValueError("Course not found")
         course_info = course.to_dict()
-        course_info['students'] = [self.get_student_info(sid) for sid in course_info['students']]
+        course_info['students'] = list(self.roster(course))
         return course_info
 
+    def roster(self, course, student_dicts=None):
+        roster = self.rosters.get(course.course_name)
+        if roster is None:
+            if student_dicts is None:
+                student_dicts = {}
+            roster = []
+            for sid in course.students:
+                student_info = student_dicts.get(sid)
+                if student_info is None:
+                    student = self.students_by_id.get(sid)
+                    if not student:
+                        raise ValueError("Student not found")
+                    student_info = student_dicts[sid] = student.to_dict()
+                roster.append(student_info)
+            self.rosters[course.course_name] = roster
+        return roster
+
+    def is_enrolled(self, student_id, course_name):
+        course = self.courses_by_name.get(course_name)
+        if not course:
+            raise ValueError("Course not found")
+        return student_id in course.students
+
+    def enrollments(self, course_names):
+        enrollments = []
+        for name in course_names:
+            course = self.courses_by_name.get(name)
+            if not course:
+                raise ValueError(f"Course not found: {name}")
+            enrollments.append(course.students)
+        return enrollments
+
+    def get_shared_students(self, *course_names):
+        # Students enrolled in every given course, e.g. for cross-listed sections
+        enrollments = self.enrollments(course_names)
+        shared = enrollments[0] if enrollments else Enrollment()
+        for enrollment in enrollments[1:]:
+            shared = shared.intersection(enrollment)
+        return list(shared)
+
+    def get_combined_students(self, *course_names):
+        # Students enrolled in at least one of the given courses
+        combined = Enrollment()
+        for enrollment in self.enrollments(course_names):
+            combined = combined.union(enrollment)
+        return list(combined)
+
+    def get_course_rosters(self, course_names=None):
+        # Resolve many rosters at once, sharing one student lookup across all courses
+        if course_names is None:
+            courses = list(self.courses_by_name.values())
+        else:
+            courses = []
+            for name in course_names:
+                course = self.courses_by_name.get(name)
+                if not course:
+                    raise ValueError(f"Course not found: {name}")
+                courses.append(course)
+        student_dicts = {}
+        rosters = {}
+        for course in courses:
+            course_info = course.to_dict()
+            course_info['students'] = list(self.roster(course, student_dicts))
+            rosters[course.course_name] = course_info
+        return rosters
+
+    def set_timetable(self, timetable):
+        # timetable maps course names to their slots; all are checked before any is set
+        masks = {}
+        for course_name, slots in timetable.items():
+            if course_name not in self.courses_by_name:
+                raise ValueError(f"Course not found: {course_name}")
+            masks[course_name] = slots_to_mask(slots)
+        for course_name, mask in masks.items():
+            self.courses_by_name[course_name].slots = mask
+        self.save()
+
+    def set_course_slots(self, course_name, slots):
+        self.set_timetable({course_name: slots})
+
+    def find_timetable_clashes(self, workers=None):
+        # Every pair of courses with overlapping slots that a student or professor
+        # is in, scanned in chunks across workers processes
+        names, professor_ids, masks, enrollments = self.timetable_inputs()
+        clashes = detect_clashes(professor_ids, masks, enrollments, workers or os.cpu_count() or 1)
+        return [
+            {"kind": kind, "id": member_id, "courses": [names[course], names[other]],
+             "slots": [slot_label(slot) for slot in iter_bits(overlap)]}
+            for kind, member_id, course, other, overlap in sorted(clashes)
+        ]
+
+    def propose_timetable(self, meetings=MEETINGS_PER_WEEK, restarts=SOLVER_RESTARTS, rounds=SOLVER_ROUNDS,
+                          seed=0, workers=None):
+        # Each course keeps its number of meetings (meetings if it has no slots yet).
+        # The solver runs restarts times from different seeds across a process pool
+        # and the cheapest result is returned; set_timetable applies it.
+        names, professor_ids, masks, enrollments = self.timetable_inputs()
+        workers = workers or os.cpu_count() or 1
+        if len(names) < PARALLEL_MIN_COURSES:
+            workers = 1
+        neighbours = conflict_graph(professor_ids, enrollments, workers)
+        needed = [bin(mask).count('1') or meetings for mask in masks]
+        results = run_parallel(solve_timetable_chunk,
+                               [(neighbours, needed, seed + restart, rounds) for restart in range(restarts)], workers)
+        cost, best = min(results, key=lambda result: result[0])
+        clashes = detect_clashes(professor_ids, best, enrollments, workers)
+        return {
+            "timetable": {name: list(iter_bits(mask)) for name, mask in zip(names, best)},
+            "cost": cost,
+            "student_clashes": sum(1 for clash in clashes if clash[0] == 'student'),
+            "professor_clashes": sum(1 for clash in clashes if clash[0] == 'professor'),
+        }
+
+# SQLite storage backend
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS professors (
+    professor_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    department TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    course_id INTEGER PRIMARY KEY,
+    course_name TEXT NOT NULL UNIQUE,
+    professor_id INTEGER NOT NULL REFERENCES professors (professor_id)
+);
+CREATE INDEX IF NOT EXISTS courses_by_professor ON courses (professor_id);
+CREATE TABLE IF NOT EXISTS enrollments (
+    course_id INTEGER NOT NULL REFERENCES courses (course_id),
+    student_id INTEGER NOT NULL REFERENCES students (student_id),
+    PRIMARY KEY (course_id, student_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS enrollments_by_student ON enrollments (student_id);
+CREATE TABLE IF NOT EXISTS course_slots (
+    course_id INTEGER NOT NULL REFERENCES courses (course_id),
+    slot INTEGER NOT NULL,
+    PRIMARY KEY (course_id, slot)
+) WITHOUT ROWID;
+"""
+
+# Statements are fixed strings with placeholders, so each pooled connection
+# prepares them once and reuses them from its statement cache
+INSERT_STUDENT = "INSERT INTO students (student_id, name, age) VALUES (?, ?, ?)"
+INSERT_PROFESSOR = "INSERT INTO professors (professor_id, name, department) VALUES (?, ?, ?)"
+INSERT_COURSE = "INSERT INTO courses (course_name, professor_id) VALUES (?, ?)"
+INSERT_ENROLLMENT = "INSERT INTO enrollments (course_id, student_id) VALUES (?, ?)"
+SELECT_STUDENT = "SELECT name, age, student_id FROM students WHERE student_id = ?"
+SELECT_PROFESSOR = "SELECT name, department, professor_id FROM professors WHERE professor_id = ?"
+SELECT_COURSE = "SELECT course_id, course_name, professor_id FROM courses WHERE course_name = ?"
+SELECT_ROSTER = """
+SELECT s.name, s.age, s.student_id FROM enrollments e
+JOIN students s ON s.student_id = e.student_id
+WHERE e.course_id = ? ORDER BY e.student_id
+"""
+SELECT_ALL_ROSTERS = """
+SELECT c.course_name, c.professor_id, s.name, s.age, s.student_id FROM courses c
+LEFT JOIN enrollments e ON e.course_id = c.course_id
+LEFT JOIN students s ON s.student_id = e.student_id
+ORDER BY c.course_id, e.student_id
+"""
+SELECT_ENROLLED = "SELECT 1 FROM enrollments WHERE course_id = ? AND student_id = ?"
+INSERT_SLOT = "INSERT INTO course_slots (course_id, slot) VALUES (?, ?)"
+DELETE_SLOTS = "DELETE FROM course_slots WHERE course_id = ?"
+SELECT_SLOTS = "SELECT slot FROM course_slots WHERE course_id = ? ORDER BY slot"
+
+# A fixed set of connections shared between threads. Readers run concurrently
+# (the database is in WAL mode); writers are serialized by a lock.
+class ConnectionPool:
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.connections = queue.Queue()
+        self.write_lock = threading.Lock()
+        for _ in range(size):
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self.connections.put(conn)
+        with self.transaction() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def connection(self):
+        conn = self.connections.get()
+        try:
+            yield conn
+        finally:
+            self.connections.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        with self.write_lock, self.connection() as conn:
+            with conn:
+                yield conn
+
+    def close(self):
+        while not self.connections.empty():
+            self.connections.get().close()
+
+# College Management System backed by SQLite: every lookup and enrollment is an
+# indexed single-row statement instead of a whole-file load or rewrite
+class SQLiteCollegeManagementSystem(CollegeManagementSystem):
+    def __init__(self, db_path=DB_FILE, pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(db_path, pool_size)
+
+    def save(self):
+        pass
+
+    def close(self):
+        self.pool.close()
+
+    def add_student(self, name, age):
+        with self.pool.transaction() as conn:
+            cursor = conn.execute(INSERT_STUDENT, (None, name, age))
+        return Student(name, age, cursor.lastrowid)
+
+    def add_professor(self, name, department):
+        with self.pool.transaction() as conn:
+            cursor = conn.execute(INSERT_PROFESSOR, (None, name, department))
+        return Professor(name, department, cursor.lastrowid)
+
+    def create_course(self, course_name, professor_id):
+        with self.pool.transaction() as conn:
+            if not conn.execute(SELECT_PROFESSOR, (professor_id,)).fetchone():
+                raise ValueError("Professor ID does not exist")
+            try:
+                conn.execute(INSERT_COURSE, (course_name, professor_id))
+            except sqlite3.IntegrityError:
+                raise ValueError("Course already exists")
+        return Course(course_name, professor_id)
+
+    def assign_student_to_course(self, student_id, course_name):
+        with self.pool.transaction() as conn:
+            if not conn.execute(SELECT_STUDENT, (student_id,)).fetchone():
+                raise ValueError("Student ID does not exist")
+            course = conn.execute(SELECT_COURSE, (course_name,)).fetchone()
+            if not course:
+                raise ValueError("Course does not exist")
+            try:
+                conn.execute(INSERT_ENROLLMENT, (course[0], student_id))
+            except sqlite3.IntegrityError:
+                raise ValueError("Student is already enrolled in this course")
+
+    def get_student_info(self, student_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_STUDENT, (student_id,)).fetchone()
+        if not row:
+            raise ValueError("Student not found")
+        return Student(*row).to_dict()
+
+    def get_professor_info(self, professor_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_PROFESSOR, (professor_id,)).fetchone()
+        if not row:
+            raise ValueError("Professor not found")
+        return Professor(*row).to_dict()
+
+    def get_course_info(self, course_name):
+        with self.pool.connection() as conn:
+            course = conn.execute(SELECT_COURSE, (course_name,)).fetchone()
+            if not course:
+                raise ValueError("Course not found")
+            students = [Student(*row).to_dict() for row in conn.execute(SELECT_ROSTER, (course[0],))]
+            slots = [row[0] for row in conn.execute(SELECT_SLOTS, (course[0],))]
+        return {"course_name": course[1], "professor_id": course[2], "students": students, "slots": slots}
+
+    def get_course_rosters(self, course_names=None):
+        if course_names is not None:
+            return {name: self.get_course_info(name) for name in course_names}
+        rosters = {}
+        with self.pool.connection() as conn:
+            for course_name, professor_id, name, age, student_id in conn.execute(SELECT_ALL_ROSTERS):
+                course_info = rosters.get(course_name)
+                if course_info is None:
+                    course_info = rosters[course_name] = {"course_name": course_name, "professor_id": professor_id, "students": []}
+                if student_id is not None:
+                    course_info["students"].append(Student(name, age, student_id).to_dict())
+        return rosters
+
+    def course_ids(self, conn, course_names):
+        ids = []
+        for name in course_names:
+            course = conn.execute(SELECT_COURSE, (name,)).fetchone()
+            if not course:
+                raise ValueError(f"Course not found: {name}")
+            ids.append(course[0])
+        return ids
+
+    def is_enrolled(self, student_id, course_name):
+        with self.pool.connection() as conn:
+            (course_id,) = self.course_ids(conn, [course_name])
+            return conn.execute(SELECT_ENROLLED, (course_id, student_id)).fetchone() is not None
+
+    def get_shared_students(self, *course_names):
+        if not course_names:
+            return []
+        with self.pool.connection() as conn:
+            ids = self.course_ids(conn, course_names)
+            placeholders = ','.join('?' * len(ids))
+            rows = conn.execute(
+                f"SELECT student_id FROM enrollments WHERE course_id IN ({placeholders}) "
+                f"GROUP BY student_id HAVING COUNT(*) = ? ORDER BY student_id", (*ids, len(set(ids))))
+            return [row[0] for row in rows]
+
+    def get_combined_students(self, *course_names):
+        if not course_names:
+            return []
+        with self.pool.connection() as conn:
+            ids = self.course_ids(conn, course_names)
+            placeholders = ','.join('?' * len(ids))
+            rows = conn.execute(
+                f"SELECT DISTINCT student_id FROM enrollments WHERE course_id IN ({placeholders}) "
+                f"ORDER BY student_id", ids)
+            return [row[0] for row in rows]
+
+    def timetable_inputs(self):
+        with self.pool.connection() as conn:
+            positions = {}
+            names, professor_ids = [], []
+            for course_id, course_name, professor_id in conn.execute(
+                    "SELECT course_id, course_name, professor_id FROM courses ORDER BY course_id"):
+                positions[course_id] = len(names)
+                names.append(course_name)
+                professor_ids.append(professor_id)
+            masks = [0] * len(names)
+            for course_id, slot in conn.execute("SELECT course_id, slot FROM course_slots"):
+                masks[positions[course_id]] |= 1 << slot
+            enrollments = [[] for _ in names]
+            for course_id, student_id in conn.execute("SELECT course_id, student_id FROM enrollments"):
+                enrollments[positions[course_id]].append(student_id)
+        return names, professor_ids, masks, enrollments
+
+    def set_timetable(self, timetable):
+        with self.pool.transaction() as conn:
+            course_ids = self.course_ids(conn, list(timetable))
+            for course_id, slots in zip(course_ids, timetable.values()):
+                mask = slots_to_mask(slots)
+                conn.execute(DELETE_SLOTS, (course_id,))
+                conn.executemany(INSERT_SLOT, ((course_id, slot) for slot in iter_bits(mask)))
+
+# Copies an existing JSON data file into a SQLite database. Duplicate course names
+# keep the first course, matching how the JSON system resolves them.
+def migrate_json_to_sqlite(json_path=DATA_FILE, db_path=DB_FILE):
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    pool = ConnectionPool(db_path, 1)
+    counts = {"students": 0, "professors": 0, "courses": 0, "enrollments": 0}
+    try:
+        with pool.transaction() as conn:
+            # IDs are copied as they are, so they would collide with existing rows
+            if any(conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() for table in ('students', 'professors', 'courses')):
+                raise ValueError(f"{db_path} already holds data; migrate into a new database")
+            conn.executemany(INSERT_STUDENT, ((s['student_id'], s['name'], s['age']) for s in data['students']))
+            counts["students"] = len(data['students'])
+            conn.executemany(INSERT_PROFESSOR, ((p['professor_id'], p['name'], p['department']) for p in data['professors']))
+            counts["professors"] = len(data['professors'])
+            for course_data in data['courses']:
+                course = Course.from_dict(course_data)
+                cursor = conn.execute("INSERT OR IGNORE INTO courses (course_name, professor_id) VALUES (?, ?)",
+                                      (course.course_name, course.professor_id))
+                if not cursor.rowcount:
+                    continue
+                counts["courses"] += 1
+                conn.executemany(INSERT_ENROLLMENT, ((cursor.lastrowid, sid) for sid in course.students))
+                conn.executemany(INSERT_SLOT, ((cursor.lastrowid, slot) for slot in iter_bits(course.slots)))
+                counts["enrollments"] += len(course.students)
+    finally:
+        pool.close()
+    return counts
+
 # Menu-driven program
 def display_menu():
     print("\nCollege Management System")
@@ -144,10 +787,26 @@ def display_menu():
     print("5. Get Student Info")
     print("6. Get Professor Info")
     print("7. Get Course Info")
-    print("8. Exit")
+    print("8. Set Course Slots")
+    print("9. Timetable Clashes")
+    print("10. Propose Timetable")
+    print("11. Exit")
 
 def main():
-    cms = CollegeManagementSystem()
+    # "python College.py migrate" copies college_data.json into college_data.db;
+    # "python College.py sqlite" runs the program against the SQLite database
+    if len(sys.argv) > 1 and sys.argv[1] == 'migrate':
+        try:
+            counts = migrate_json_to_sqlite()
+        except (OSError, ValueError) as e:
+            print(f"Migration failed: {e}")
+            return
+        print(f"Migrated {counts} into {DB_FILE}")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'sqlite':
+        cms = SQLiteCollegeManagementSystem()
+    else:
+        cms = CollegeManagementSystem()
     
     while True:
         display_menu()
@@ -208,6 +867,31 @@ def main():
                 print(e)
         
         elif choice == '8':
+            course_name = input("Enter course name: ")
+            slots = input("Enter meeting slots, e.g. Mon 1, Wed 1 (blank to clear): ")
+            try:
+                cms.set_course_slots(course_name, [slot.strip() for slot in slots.split(',') if slot.strip()])
+                print(f"Course Info: {cms.get_course_info(course_name)}")
+            except ValueError as e:
+                print(e)
+
+        elif choice == '9':
+            clashes = cms.find_timetable_clashes()
+            for clash in clashes:
+                print(f"{clash['kind'].title()} {clash['id']}: {' and '.join(clash['courses'])} both meet {', '.join(clash['slots'])}")
+            print(f"{len(clashes)} clashes found.")
+
+        elif choice == '10':
+            proposal = cms.propose_timetable()
+            for course_name, slots in proposal['timetable'].items():
+                print(f"{course_name}: {', '.join(slot_label(slot) for slot in slots)}")
+            print(f"Proposal leaves {proposal['student_clashes']} student and "
+                  f"{proposal['professor_clashes']} professor clashes.")
+            if input("Apply this timetable? (y/n): ").lower() == 'y':
+                cms.set_timetable(proposal['timetable'])
+                print("Timetable applied.")
+
+        elif choice == '11':
             print("Exiting the program.")
             break
         
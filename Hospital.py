@@ -1,51 +1,507 @@
 import datetime
+import heapq
+import os
+import pickle
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
 
-class Hospital:
+# Data Storage
+SNAPSHOT_FILE = 'hospital_data.bin'
+JOURNAL_FILE = 'hospital_data.journal'
+CHECKPOINT_INTERVAL = 10000
+SNAPSHOT_VERSION = 2
+
+# Doctor calendars: each working day is split into fixed slots, and a doctor's
+# bookings for one day are a single int bitmap (bit i set = slot i is taken)
+DAY_START = datetime.timedelta(hours=9)
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 16
+FULL_DAY = (1 << SLOTS_PER_DAY) - 1
+SEARCH_HORIZON_DAYS = 365
+
+def parse_day(date):
+    if isinstance(date, str):
+        date = datetime.datetime.strptime(date, '%Y-%m-%d')
+    elif not isinstance(date, datetime.date):
+        raise ValueError("Invalid date.")
+    return date.toordinal()
+
+def parse_slot(time):
+    try:
+        hours, minutes = map(int, time.split(':'))
+    except ValueError:
+        raise ValueError("Time must be in HH:MM format")
+    offset = datetime.timedelta(hours=hours, minutes=minutes) - DAY_START
+    slot, remainder = divmod(int(offset.total_seconds()) // 60, SLOT_MINUTES)
+    if remainder or not 0 <= slot < SLOTS_PER_DAY:
+        raise ValueError("Time is not the start of an appointment slot")
+    return slot
+
+def slot_start(day, slot):
+    return datetime.datetime.fromordinal(day) + DAY_START + datetime.timedelta(minutes=slot * SLOT_MINUTES)
+
+def lowest_free_slot(bitmap, from_slot=0):
+    free = ~bitmap & FULL_DAY & (FULL_DAY << from_slot)
+    if not free:
+        return None
+    return (free & -free).bit_length() - 1
+
+# The snapshot is a single pickle of flat tuples that refer to each other by ID,
+# so loading it never has to walk the patient/doctor/appointment object graph.
+def load_snapshot():
+    if not os.path.exists(SNAPSHOT_FILE):
+        return None
+    with open(SNAPSHOT_FILE, 'rb') as f:
+        return pickle.load(f)
+
+def save_snapshot(snapshot):
+    tmp_file = SNAPSHOT_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, SNAPSHOT_FILE)
+
+# The journal is a sequence of length-prefixed pickled tuples
+JOURNAL_HEADER = struct.Struct('<I')
+
+def append_journal(records):
+    chunks = []
+    for record in records:
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        chunks.append(JOURNAL_HEADER.pack(len(payload)))
+        chunks.append(payload)
+    with open(JOURNAL_FILE, 'ab') as f:
+        f.write(b''.join(chunks))
+
+def load_journal():
+    if not os.path.exists(JOURNAL_FILE):
+        return []
+    with open(JOURNAL_FILE, 'rb') as f:
+        buffer = f.read()
+    records = []
+    offset = 0
+    while offset + JOURNAL_HEADER.size <= len(buffer):
+        (length,) = JOURNAL_HEADER.unpack_from(buffer, offset)
+        offset += JOURNAL_HEADER.size
+        if offset + length > len(buffer):
+            # A torn final record from an interrupted append; nothing after it was committed
+            break
+        records.append(pickle.loads(buffer[offset:offset + length]))
+        offset += length
+    return records
+
+def clear_journal():
+    with open(JOURNAL_FILE, 'wb'):
+        pass
+
+# Fuzzy search: names are broken into padded word trigrams ("  j", " jo", "joh",
+# ...) and phone numbers into digit trigrams, so misspellings and partial numbers
+# still share most trigrams with the stored record
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+MAX_POSTING_SCAN = 50000
+
+def text_trigrams(text):
+    grams = set()
+    for word in WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def digit_trigrams(text):
+    digits = ''.join(c for c in text if c.isdigit())
+    return {'#' + digits[i:i + 3] for i in range(len(digits) - 2)}
+
+# Inverted index from trigram to the IDs of records containing it. Records are
+# ranked by how many of the query's trigrams they share, ties going to the
+# record with fewer trigrams overall (the closer match).
+class TrigramIndex:
     def __init__(self):
+        self.postings = {}
+        self.sizes = {}
+
+    def add(self, record_id, grams):
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(record_id)
+        self.sizes[record_id] = len(grams)
+
+    def search(self, grams, limit):
+        # Very common trigrams are skipped when rarer ones exist, so one popular
+        # first name cannot make a query scan most of the registry
+        postings = sorted((self.postings[g] for g in grams if g in self.postings), key=len)
+        hits = Counter()
+        for i, posting in enumerate(postings):
+            if i and len(posting) > MAX_POSTING_SCAN:
+                break
+            hits.update(posting)
+        sizes = self.sizes
+        return heapq.nlargest(limit, hits, key=lambda record_id: (hits[record_id], -sizes[record_id]))
+
+def query_trigrams(text):
+    return text_trigrams(text) | digit_trigrams(text)
+
+class Hospital:
+    def __init__(self, persistent=True, checkpoint_interval=CHECKPOINT_INTERVAL):
         self.patients = []
         self.doctors = []
+        self.patients_by_id = {}
+        self.doctors_by_id = {}
+        self.doctors_by_specialization = {}
+        # Hospital-wide schedule: day -> (sorted (slot, doctor ID) keys, appointments)
+        self.schedule = {}
+        # Search indexes are built on first search, then kept current
+        self.patient_search = None
+        self.doctor_search = None
+        self.persistent = persistent
+        self.checkpoint_interval = checkpoint_interval
+        self.journal_seq = 0
+        self.pending_records = 0
+        if persistent:
+            self.load()
+
+    def load(self):
+        snapshot = load_snapshot()
+        if snapshot:
+            self.journal_seq = snapshot['seq']
+            self.restore(snapshot)
+        for record in load_journal():
+            if record[1] <= self.journal_seq:
+                continue
+            self.apply(record)
+            self.journal_seq = record[1]
+            self.pending_records += 1
+
+    def restore(self, snapshot):
+        doctors_by_id = self.doctors_by_id
+        for doctor_id, name, specialization, contact in snapshot['doctors']:
+            self.index_doctor(Doctor(name, specialization, contact, doctor_id))
+        patients_by_id = self.patients_by_id
+        for patient_id, name, age, gender, contact, doctor_id in snapshot['patients']:
+            patient = Patient(name, age, gender, contact, patient_id)
+            if doctor_id:
+                patient.assign_doctor(doctors_by_id[doctor_id])
+            self.index_patient(patient)
+        for patient_id, doctor_id, day, *slot in snapshot['appointments']:
+            # Version 1 snapshots have no slots; those appointments take the first free one
+            self.place(patients_by_id[patient_id], doctors_by_id[doctor_id], day, slot[0] if slot else None)
+        Patient._id_counter = max(Patient._id_counter, snapshot['patient_counter'])
+        Doctor._id_counter = max(Doctor._id_counter, snapshot['doctor_counter'])
+
+    def apply(self, record):
+        kind = record[0]
+        if kind == 'patient':
+            self.index_patient(Patient(*record[3:], patient_id=record[2]))
+        elif kind == 'doctor':
+            self.index_doctor(Doctor(*record[3:], doctor_id=record[2]))
+        elif kind == 'assign':
+            self.find_patient_by_id(record[2]).assign_doctor(self.find_doctor_by_id(record[3]))
+        elif kind == 'appointment':
+            slot = record[5] if len(record) > 5 else None
+            self.place(self.find_patient_by_id(record[2]), self.find_doctor_by_id(record[3]), record[4], slot)
+        else:
+            raise ValueError(f"Unknown journal record: {kind}")
+
+    def index_patient(self, patient):
+        self.patients.append(patient)
+        self.patients_by_id[patient.patient_id] = patient
+        if self.patient_search is not None:
+            self.patient_search.add(patient.patient_id, text_trigrams(patient.name) | digit_trigrams(patient.contact))
+
+    def index_doctor(self, doctor):
+        self.doctors.append(doctor)
+        self.doctors_by_id[doctor.doctor_id] = doctor
+        self.doctors_by_specialization.setdefault(doctor.specialization, []).append(doctor)
+        if self.doctor_search is not None:
+            self.doctor_search.add(doctor.doctor_id, text_trigrams(f"{doctor.name} {doctor.specialization}"))
+
+    def search_patients(self, text, limit=10):
+        if self.patient_search is None:
+            self.patient_search = TrigramIndex()
+            for patient in self.patients:
+                self.patient_search.add(patient.patient_id, text_trigrams(patient.name) | digit_trigrams(patient.contact))
+        return [self.patients_by_id[i] for i in self.patient_search.search(query_trigrams(text), limit)]
+
+    def search_doctors(self, text, limit=10):
+        if self.doctor_search is None:
+            self.doctor_search = TrigramIndex()
+            for doctor in self.doctors:
+                self.doctor_search.add(doctor.doctor_id, text_trigrams(f"{doctor.name} {doctor.specialization}"))
+        return [self.doctors_by_id[i] for i in self.doctor_search.search(query_trigrams(text), limit)]
+
+    def place(self, patient, doctor, day, slot=None):
+        if slot is None:
+            slot = lowest_free_slot(doctor.calendar.get(day, 0))
+            if slot is None:
+                slot = 0
+        doctor.book_slot(day, slot)
+        appointment = Appointment(patient, doctor, slot_start(day, slot), slot)
+        patient.add_appointment(appointment)
+        doctor.add_appointment(appointment)
+        day_keys, day_appointments = self.schedule.setdefault(day, ([], []))
+        key = (slot, doctor.doctor_id)
+        index = bisect_right(day_keys, key)
+        day_keys.insert(index, key)
+        day_appointments.insert(index, appointment)
+        return appointment
+
+    def snapshot(self):
+        appointments = []
+        for doctor in self.doctors:
+            for appointment in doctor.appointments:
+                appointments.append((appointment.patient.patient_id, doctor.doctor_id, appointment.date.toordinal(), appointment.slot))
+        return {
+            'version': SNAPSHOT_VERSION,
+            'seq': self.journal_seq,
+            'patient_counter': Patient._id_counter,
+            'doctor_counter': Doctor._id_counter,
+            'doctors': [(d.doctor_id, d.name, d.specialization, d.contact) for d in self.doctors],
+            'patients': [
+                (p.patient_id, p.name, p.age, p.gender, p.contact, p.doctor.doctor_id if p.doctor else 0)
+                for p in self.patients
+            ],
+            'appointments': appointments,
+        }
+
+    def checkpoint(self):
+        if not self.persistent:
+            return
+        save_snapshot(self.snapshot())
+        clear_journal()
+        self.pending_records = 0
+
+    def record(self, *records):
+        journaled = []
+        for record in records:
+            self.journal_seq += 1
+            journaled.append((record[0], self.journal_seq) + record[1:])
+        if not self.persistent:
+            return
+        append_journal(journaled)
+        self.pending_records += len(journaled)
+        if self.pending_records >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def register_patient(self, name, age, gender, contact):
+        patient = Patient(name, age, gender, contact)
+        self.index_patient(patient)
+        self.record(('patient', patient.patient_id, name, age, gender, contact))
+        return patient
+
+    def register_doctor(self, name, specialization, contact):
+        doctor = Doctor(name, specialization, contact)
+        self.index_doctor(doctor)
+        self.record(('doctor', doctor.doctor_id, name, specialization, contact))
+        return doctor
+
+    def assign_doctor(self, patient_id, doctor_id):
+        patient = self.find_patient_by_id(patient_id)
+        doctor = self.find_doctor_by_id(doctor_id)
+        if not patient or not doctor:
+            raise ValueError("Invalid patient ID or doctor ID.")
+        patient.assign_doctor(doctor)
+        self.record(('assign', patient_id, doctor_id))
+        return patient
+
+    def book_appointment(self, patient_id, doctor_id, date, slot=None):
+        patient = self.find_patient_by_id(patient_id)
+        doctor = self.find_doctor_by_id(doctor_id)
+        if not patient or not doctor:
+            raise ValueError("Invalid patient ID or doctor ID.")
+        day = parse_day(date)
+        slot = self.choose_slot(doctor, day, slot)
+        appointment = self.place(patient, doctor, day, slot)
+        self.record(('appointment', patient_id, doctor_id, day, slot))
+        return appointment
+
+    def choose_slot(self, doctor, day, slot):
+        bitmap = doctor.calendar.get(day, 0)
+        if slot is None:
+            slot = lowest_free_slot(bitmap)
+            if slot is None:
+                raise ValueError(f"Doctor {doctor.name} has no free slots on that day.")
+        elif not isinstance(slot, int) or not 0 <= slot < SLOTS_PER_DAY:
+            raise ValueError("Invalid appointment slot.")
+        elif bitmap >> slot & 1:
+            raise ValueError(f"Doctor {doctor.name} is already booked at that time.")
+        return slot
+
+    def schedule_appointments(self, requests):
+        # Bulk scheduling: each request is (patient_id, doctor_id, date) or
+        # (patient_id, doctor_id, date, slot). Requests that cannot be placed are
+        # reported rather than aborting the batch, and the journal is written once.
+        appointments = []
+        failures = []
+        records = []
+        days = {}
+        try:
+            for index, request in enumerate(requests):
+                try:
+                    if not isinstance(request, (tuple, list)) or len(request) not in (3, 4):
+                        raise ValueError("Expected (patient_id, doctor_id, date) or (patient_id, doctor_id, date, slot).")
+                    patient_id, doctor_id, date, *slot = request
+                    patient = self.patients_by_id.get(patient_id)
+                    doctor = self.doctors_by_id.get(doctor_id)
+                    if not patient or not doctor:
+                        raise ValueError("Invalid patient ID or doctor ID.")
+                    day = days.get(date)
+                    if day is None:
+                        day = days[date] = parse_day(date)
+                    chosen = self.choose_slot(doctor, day, slot[0] if slot else None)
+                except (TypeError, ValueError) as e:
+                    failures.append((index, str(e)))
+                    continue
+                appointments.append(self.place(patient, doctor, day, chosen))
+                records.append(('appointment', patient_id, doctor_id, day, chosen))
+        finally:
+            # Whatever was placed in memory is journaled, even if the batch is cut short
+            self.record(*records)
+        return appointments, failures
+
+    def find_next_free_slot(self, doctor_id, after):
+        doctor = self.find_doctor_by_id(doctor_id)
+        if not doctor:
+            raise ValueError("Invalid doctor ID.")
+        if isinstance(after, str):
+            after = datetime.datetime.fromisoformat(after)
+        day = after.toordinal()
+        minutes = (after - datetime.datetime.fromordinal(day) - DAY_START).total_seconds() / 60
+        from_slot = max(0, -(-int(minutes) // SLOT_MINUTES))
+        for offset in range(SEARCH_HORIZON_DAYS):
+            if from_slot < SLOTS_PER_DAY:
+                slot = lowest_free_slot(doctor.calendar.get(day + offset, 0), from_slot)
+                if slot is not None:
+                    return slot_start(day + offset, slot)
+            from_slot = 0
+        return None
+
+    def find_free_doctors(self, specialization, date):
+        day = parse_day(date)
+        return [
+            d for d in self.doctors_by_specialization.get(specialization, [])
+            if d.calendar.get(day, 0) != FULL_DAY
+        ]
+
+    # Agenda queries return generators over the sorted indexes, so a busy day
+    # or a long date range is streamed rather than copied into a new list
+    def doctor_agenda(self, doctor_id, start, end):
+        doctor = self.find_doctor_by_id(doctor_id)
+        if not doctor:
+            raise ValueError("Invalid doctor ID.")
+        first, last = parse_day(start), parse_day(end)
+        if last < first:
+            raise ValueError("End date must not be before start date.")
+        return doctor.agenda(first * SLOTS_PER_DAY, (last + 1) * SLOTS_PER_DAY)
+
+    def daily_schedule(self, date):
+        _, appointments = self.schedule.get(parse_day(date), ((), ()))
+        return (appointment for appointment in appointments)
 
     def add_patient(self):
         name = input("Enter patient name: ")
         age = int(input("Enter patient age: "))
         gender = input("Enter patient gender: ")
         contact = input("Enter patient contact number: ")
-        patient = Patient(name, age, gender, contact)
-        self.patients.append(patient)
+        self.register_patient(name, age, gender, contact)
         print(f"Patient {name} added successfully.\n")
 
     def add_doctor(self):
         name = input("Enter doctor name: ")
         specialization = input("Enter doctor specialization: ")
         contact = input("Enter doctor contact number: ")
-        doctor = Doctor(name, specialization, contact)
-        self.doctors.append(doctor)
+        self.register_doctor(name, specialization, contact)
         print(f"Doctor {name} added successfully.\n")
 
     def assign_doctor_to_patient(self):
         patient_id = int(input("Enter patient ID: "))
         doctor_id = int(input("Enter doctor ID: "))
-        patient = self.find_patient_by_id(patient_id)
-        doctor = self.find_doctor_by_id(doctor_id)
-        if patient and doctor:
-            patient.assign_doctor(doctor)
-            print(f"Doctor {doctor.name} assigned to patient {patient.name}.\n")
-        else:
-            print("Invalid patient ID or doctor ID.\n")
+        try:
+            patient = self.assign_doctor(patient_id, doctor_id)
+            print(f"Doctor {patient.doctor.name} assigned to patient {patient.name}.\n")
+        except ValueError as e:
+            print(f"{e}\n")
 
     def schedule_appointment(self):
         patient_id = int(input("Enter patient ID: "))
         doctor_id = int(input("Enter doctor ID: "))
         date = input("Enter appointment date (YYYY-MM-DD): ")
-        patient = self.find_patient_by_id(patient_id)
-        doctor = self.find_doctor_by_id(doctor_id)
-        if patient and doctor:
-            appointment = Appointment(patient, doctor, date)
-            patient.add_appointment(appointment)
-            doctor.add_appointment(appointment)
-            print(f"Appointment scheduled for patient {patient.name} with doctor {doctor.name} on {date}.\n")
+        time = input("Enter appointment time (HH:MM, blank for first free slot): ")
+        try:
+            slot = parse_slot(time) if time else None
+            appointment = self.book_appointment(patient_id, doctor_id, date, slot)
+            print(f"Appointment scheduled for patient {appointment.patient.name} with doctor {appointment.doctor.name} on {appointment.date.strftime('%Y-%m-%d %H:%M')}.\n")
+        except ValueError as e:
+            print(f"{e}\n")
+
+    def next_free_slot(self):
+        doctor_id = int(input("Enter doctor ID: "))
+        after = input("Enter earliest date and time (YYYY-MM-DD HH:MM): ")
+        try:
+            start = self.find_next_free_slot(doctor_id, after)
+            if start:
+                print(f"Next free slot: {start.strftime('%Y-%m-%d %H:%M')}\n")
+            else:
+                print(f"No free slot in the next {SEARCH_HORIZON_DAYS} days.\n")
+        except ValueError as e:
+            print(f"{e}\n")
+
+    def free_doctors(self):
+        specialization = input("Enter specialization: ")
+        date = input("Enter date (YYYY-MM-DD): ")
+        try:
+            doctors = self.find_free_doctors(specialization, date)
+        except ValueError as e:
+            print(f"{e}\n")
+            return
+        if doctors:
+            print("Doctors with free slots:")
+            for doctor in doctors:
+                print(doctor)
         else:
-            print("Invalid patient ID or doctor ID.\n")
+            print("No free doctors found.\n")
+
+    def find_patients(self):
+        text = input("Enter name or contact number (partial or misspelled is fine): ")
+        patients = self.search_patients(text)
+        if patients:
+            print("Matching Patients:")
+            for patient in patients:
+                print(patient)
+        else:
+            print("No matching patients found.\n")
+
+    def view_doctor_agenda(self):
+        doctor_id = int(input("Enter doctor ID: "))
+        start = input("Enter start date (YYYY-MM-DD): ")
+        end = input("Enter end date (YYYY-MM-DD): ")
+        try:
+            agenda = self.doctor_agenda(doctor_id, start, end)
+        except ValueError as e:
+            print(f"{e}\n")
+            return
+        found = False
+        for appointment in agenda:
+            found = True
+            print(appointment)
+        if not found:
+            print("No appointments found.\n")
+
+    def view_daily_schedule(self):
+        date = input("Enter date (YYYY-MM-DD): ")
+        try:
+            schedule = self.daily_schedule(date)
+        except ValueError as e:
+            print(f"{e}\n")
+            return
+        found = False
+        for appointment in schedule:
+            found = True
+            print(appointment)
+        if not found:
+            print("No appointments found.\n")
 
     def view_patients(self):
         if self.patients:
@@ -68,35 +524,31 @@ class Hospital:
         patient = self.find_patient_by_id(patient_id)
         if patient:
             print(f"Appointments for patient {patient.name}:")
-            for appointment in patient.appointments:
+            for appointment in sorted(patient.appointments, key=lambda a: (a.date, a.doctor.doctor_id)):
                 print(appointment)
         else:
             print("Invalid patient ID.\n")
 
     def find_patient_by_id(self, patient_id):
-        for patient in self.patients:
-            if patient.patient_id == patient_id:
-                return patient
-        return None
+        return self.patients_by_id.get(patient_id)
 
     def find_doctor_by_id(self, doctor_id):
-        for doctor in self.doctors:
-            if doctor.doctor_id == doctor_id:
-                return doctor
-        return None
+        return self.doctors_by_id.get(doctor_id)
 
 class Patient:
     _id_counter = 1
 
-    def __init__(self, name, age, gender, contact):
-        self.patient_id = Patient._id_counter
+    def __init__(self, name, age, gender, contact, patient_id=None):
+        if patient_id is None:
+            patient_id = Patient._id_counter
+        self.patient_id = patient_id
         self.name = name
         self.age = age
         self.gender = gender
         self.contact = contact
         self.doctor = None
         self.appointments = []
-        Patient._id_counter += 1
+        Patient._id_counter = max(Patient._id_counter, patient_id + 1)
 
     def assign_doctor(self, doctor):
         self.doctor = doctor
@@ -110,32 +562,52 @@ class Patient:
 class Doctor:
     _id_counter = 1
 
-    def __init__(self, name, specialization, contact):
-        self.doctor_id = Doctor._id_counter
+    def __init__(self, name, specialization, contact, doctor_id=None):
+        if doctor_id is None:
+            doctor_id = Doctor._id_counter
+        self.doctor_id = doctor_id
         self.name = name
         self.specialization = specialization
         self.contact = contact
         self.patients = []
+        # Appointments are kept sorted by timeline key (day * SLOTS_PER_DAY + slot)
         self.appointments = []
-        Doctor._id_counter += 1
+        self.timeline = []
+        self.calendar = {}
+        Doctor._id_counter = max(Doctor._id_counter, doctor_id + 1)
 
     def add_patient(self, patient):
         self.patients.append(patient)
 
+    def book_slot(self, day, slot):
+        self.calendar[day] = self.calendar.get(day, 0) | (1 << slot)
+
     def add_appointment(self, appointment):
-        self.appointments.append(appointment)
+        key = appointment.date.toordinal() * SLOTS_PER_DAY + appointment.slot
+        index = bisect_right(self.timeline, key)
+        self.timeline.insert(index, key)
+        self.appointments.insert(index, appointment)
+
+    def agenda(self, start_key, end_key):
+        index = bisect_left(self.timeline, start_key)
+        while index < len(self.timeline) and self.timeline[index] < end_key:
+            yield self.appointments[index]
+            index += 1
 
     def __str__(self):
         return f"ID: {self.doctor_id}, Name: {self.name}, Specialization: {self.specialization}, Contact: {self.contact}"
 
 class Appointment:
-    def __init__(self, patient, doctor, date):
+    def __init__(self, patient, doctor, date, slot=0):
         self.patient = patient
         self.doctor = doctor
-        self.date = datetime.datetime.strptime(date, '%Y-%m-%d')
+        if isinstance(date, str):
+            date = datetime.datetime.strptime(date, '%Y-%m-%d')
+        self.date = date
+        self.slot = slot
 
     def __str__(self):
-        return f"Patient: {self.patient.name}, Doctor: {self.doctor.name}, Date: {self.date.strftime('%Y-%m-%d')}"
+        return f"Patient: {self.patient.name}, Doctor: {self.doctor.name}, Date: {self.date.strftime('%Y-%m-%d %H:%M')}"
 
 def main():
     hospital = Hospital()
@@ -148,7 +620,12 @@ def main():
         print("5. View Patients")
         print("6. View Doctors")
         print("7. View Appointments")
-        print("8. Exit")
+        print("8. Find Next Free Slot")
+        print("9. Find Free Doctors")
+        print("10. Search Patients")
+        print("11. Doctor Agenda")
+        print("12. Daily Schedule")
+        print("13. Exit")
         choice = input("Enter your choice: ")
         if choice == '1':
             hospital.add_patient()
@@ -165,6 +642,17 @@ def main():
         elif choice == '7':
             hospital.view_appointments()
         elif choice == '8':
+            hospital.next_free_slot()
+        elif choice == '9':
+            hospital.free_doctors()
+        elif choice == '10':
+            hospital.find_patients()
+        elif choice == '11':
+            hospital.view_doctor_agenda()
+        elif choice == '12':
+            hospital.view_daily_schedule()
+        elif choice == '13':
+            hospital.checkpoint()
             print("Exiting...")
             break
         else:
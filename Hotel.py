@@ -1,8 +1,15 @@
 import json
 import os
+import sys
+import threading
+from bisect import bisect_right
+from datetime import date, datetime
 
 # Data Storage
 DATA_FILE = 'hotel_data.json'
+SEGMENT_DIR = 'hotel_reservations'
+JOURNAL_FILE = 'hotel_data.journal'
+SNAPSHOT_INTERVAL = 5.0
 
 # Initialize data storage if it does not exist
 if not os.path.exists(DATA_FILE):
@@ -15,8 +22,55 @@ def load_data():
         return json.load(f)
 
 def save_data(data):
-    with open(DATA_FILE, 'w') as f:
+    # Written to a temporary file and renamed, so a crash during a save never
+    # leaves a half-written data file
+    tmp_file = DATA_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_file, DATA_FILE)
+
+# Change journal (one compact JSON entry per line) holding the mutations made
+# since the last snapshot of the data file
+def append_journal(line):
+    with open(JOURNAL_FILE, 'a') as f:
+        f.write(line)
+
+def load_journal():
+    if not os.path.exists(JOURNAL_FILE):
+        return []
+    entries = []
+    with open(JOURNAL_FILE, 'r') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append; nothing after it was committed
+                break
+    return entries
+
+def rewrite_journal(lines):
+    tmp_file = JOURNAL_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.writelines(lines)
+    os.replace(tmp_file, JOURNAL_FILE)
+
+# In lazy mode reservations live in one segment file per check-in month
+def segment_path(month):
+    return os.path.join(SEGMENT_DIR, f'{month}.json')
+
+def load_segment(month):
+    with open(segment_path(month), 'r') as f:
+        return json.load(f)
+
+def save_segment(month, records):
+    os.makedirs(SEGMENT_DIR, exist_ok=True)
+    tmp_file = segment_path(month) + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(records, f, separators=(',', ':'))
+    os.replace(tmp_file, segment_path(month))
+
+def stay_month(check_in_date):
+    return check_in_date[:7]
 
 # Room management
 class Room:
@@ -68,44 +122,440 @@ class Reservation:
     def from_dict(data):
         return Reservation(data['reservation_id'], data['room_number'], data['guest_id'], data['check_in_date'], data['check_out_date'])
 
+# Per-room booking calendar: stays kept sorted by check-in date as half-open
+# [check_in, check_out) ranges. reach[i] is the latest check-out among the first
+# i + 1 stays (reach_ids[i] its reservation), so a conflict is found from the
+# neighbours of the insertion point even if stored stays overlap each other.
+class RoomCalendar:
+    def __init__(self):
+        self.check_ins = []
+        self.check_outs = []
+        self.reservation_ids = []
+        self.reach = []
+        self.reach_ids = []
+
+    def conflict(self, check_in, check_out):
+        i = bisect_right(self.check_ins, check_in)
+        if i > 0 and self.reach[i - 1] > check_in:
+            return self.reach_ids[i - 1]
+        if i < len(self.check_ins) and self.check_ins[i] < check_out:
+            return self.reservation_ids[i]
+        return None
+
+    def is_free(self, check_in, check_out):
+        return self.conflict(check_in, check_out) is None
+
+    def add(self, check_in, check_out, reservation_id):
+        i = bisect_right(self.check_ins, check_in)
+        self.check_ins.insert(i, check_in)
+        self.check_outs.insert(i, check_out)
+        self.reservation_ids.insert(i, reservation_id)
+        if i > 0 and self.reach[i - 1] >= check_out:
+            self.reach.insert(i, self.reach[i - 1])
+            self.reach_ids.insert(i, self.reach_ids[i - 1])
+            return
+        self.reach.insert(i, check_out)
+        self.reach_ids.insert(i, reservation_id)
+        # Later entries only change up to the first one that already reaches further;
+        # without overlaps that is the next one
+        for j in range(i + 1, len(self.reach)):
+            if self.reach[j] >= check_out:
+                break
+            self.reach[j] = check_out
+            self.reach_ids[j] = reservation_id
+
+# Returns the stay normalized to zero-padded ISO dates, which sort correctly as strings
+def validate_stay(check_in_date, check_out_date):
+    try:
+        check_in = datetime.strptime(check_in_date, '%Y-%m-%d')
+        check_out = datetime.strptime(check_out_date, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError("Dates must be in YYYY-MM-DD format")
+    if check_out <= check_in:
+        raise ValueError("Check-out date must be after check-in date")
+    return check_in.date().isoformat(), check_out.date().isoformat()
+
+# Stored stays may predate validate_stay; ones already in its output form are
+# returned as they are without the slower strptime parse
+def normalize_stay(check_in_date, check_out_date):
+    try:
+        if (date.fromisoformat(check_in_date).isoformat() == check_in_date
+                and date.fromisoformat(check_out_date).isoformat() == check_out_date
+                and check_in_date < check_out_date):
+            return check_in_date, check_out_date
+    except (TypeError, ValueError):
+        pass
+    return validate_stay(check_in_date, check_out_date)
+
+# Raised when any item of a group booking fails; nothing from the group is booked.
+# errors lists (item index, message) for every failing item.
+class GroupBookingError(ValueError):
+    def __init__(self, errors, item_count):
+        self.errors = errors
+        details = "; ".join(f"item {index}: {message}" for index, message in errors)
+        super().__init__(f"{len(errors)} of {item_count} group items failed, nothing was booked ({details})")
+
 # Main Hotel Management System
 class HotelManagementSystem:
-    def __init__(self):
+    # In background mode a mutation only appends a change entry to the journal;
+    # a snapshot thread writes the data file every snapshot_interval seconds and
+    # trims the journal to the entries made since
+    def __init__(self, lazy=False, background=False, snapshot_interval=SNAPSHOT_INTERVAL):
         self.data = load_data()
+        # Data already split into segments stays that way; eager mode then loads
+        # every segment up front instead of reading the empty reservations list
+        self.lazy = lazy or bool(self.data.get('segments')) or os.path.isdir(SEGMENT_DIR)
+        self.background = background
+        self.snapshot_interval = snapshot_interval
+        # With autosave off, callers batch several mutations and call save() themselves
+        self.autosave = True
+        # lock guards mutations against a snapshot being captured mid-change;
+        # save_lock keeps two snapshots from being written at once
+        self.lock = threading.RLock()
+        self.save_lock = threading.Lock()
         self.rooms = [Room.from_dict(r) for r in self.data['rooms']]
         self.guests = [Guest.from_dict(g) for g in self.data['guests']]
-        self.reservations = [Reservation.from_dict(r) for r in self.data['reservations']]
+        self.guests_by_id = {g.guest_id: g for g in self.guests}
+        self.calendars = {r.room_number: RoomCalendar() for r in self.rooms}
+        # Callables notified with each new Reservation, e.g. to keep reports current
+        self.reservation_listeners = []
+        # (reservation_id, problem) for stored stays with invalid dates, which are
+        # left out of the calendars, or that overlap another stored stay
+        self.stay_problems = []
+        # Set before loading reservations, since migrating to segments saves
+        self.change_seq = self.data.get('change_seq', 0)
+        self.snapshot_seq = self.change_seq
+        # (seq, journal line) for changes not yet covered by a snapshot
+        self.pending_changes = []
+        self.journal_entries = 0
+        if self.lazy:
+            self.init_segments()
+            if not lazy:
+                self.load_reservations()
+        else:
+            self.reservations = [Reservation.from_dict(r) for r in self.data['reservations']]
+            for reservation in sorted(self.reservations, key=lambda r: r.check_in_date):
+                self.index_reservation(reservation)
+        self.replay_journal()
+        if background:
+            self.stop_event = threading.Event()
+            self.snapshot_thread = threading.Thread(target=self.snapshot_loop, name='hotel-snapshots', daemon=True)
+            self.snapshot_thread.start()
+
+    def init_segments(self):
+        # Only the segment manifest is read at startup: per check-in month, the
+        # reservation count, ID range and latest check-out date
+        self.reservations = []
+        self.segments = {}
+        self.dirty_segments = set()
+        self.manifest = self.data.setdefault('segments', {})
+        # Segment files missing from the manifest, as an eager save used to leave
+        # them, are read back in
+        if os.path.isdir(SEGMENT_DIR):
+            for name in sorted(os.listdir(SEGMENT_DIR)):
+                month, extension = os.path.splitext(name)
+                if extension == '.json' and month not in self.manifest:
+                    self.materialize(month)
+                    for reservation in self.segments[month]:
+                        self.track_segment(reservation)
+        if self.data['reservations']:
+            # One-time migration of an eagerly stored history into monthly segments
+            migrated = []
+            for record in self.data['reservations']:
+                reservation = Reservation.from_dict(record)
+                try:
+                    reservation.check_in_date, reservation.check_out_date = normalize_stay(reservation.check_in_date, reservation.check_out_date)
+                except (TypeError, ValueError):
+                    pass
+                month = stay_month(reservation.check_in_date)
+                # The month's segment file is rewritten whole on save, so it must be
+                # loaded before migrated stays are added to it
+                if month in self.manifest and month not in self.segments:
+                    self.materialize(month)
+                self.segments.setdefault(month, []).append(reservation)
+                self.reservations.append(reservation)
+                self.track_segment(reservation)
+                migrated.append(reservation)
+            for reservation in sorted(migrated, key=lambda r: r.check_in_date):
+                self.index_reservation(reservation)
+        self.data['next_reservation_id'] = max(
+            self.data.get('next_reservation_id', 1),
+            max((entry["max_id"] for entry in self.manifest.values()), default=0) + 1,
+        )
+        if self.data['reservations'] or self.dirty_segments:
+            self.save()
+
+    def track_segment(self, reservation):
+        month = stay_month(reservation.check_in_date)
+        entry = self.manifest.get(month)
+        if entry is None:
+            entry = self.manifest[month] = {
+                "count": 0,
+                "min_id": reservation.reservation_id,
+                "max_id": reservation.reservation_id,
+                "max_check_out": reservation.check_out_date,
+            }
+        entry["count"] += 1
+        entry["min_id"] = min(entry["min_id"], reservation.reservation_id)
+        entry["max_id"] = max(entry["max_id"], reservation.reservation_id)
+        entry["max_check_out"] = max(entry["max_check_out"], reservation.check_out_date)
+        self.dirty_segments.add(month)
+
+    def materialize(self, month):
+        reservations = [Reservation.from_dict(r) for r in load_segment(month)]
+        self.segments[month] = reservations
+        self.reservations.extend(reservations)
+        for reservation in reservations:
+            self.index_reservation(reservation)
+
+    def load_reservations(self, check_in_date=None, check_out_date=None):
+        # Materialize every segment holding a stay that overlaps [check_in, check_out);
+        # with no range, materialize the whole history
+        if not self.lazy:
+            return
+        for month, entry in self.manifest.items():
+            if month in self.segments:
+                continue
+            if check_out_date is not None and month > stay_month(check_out_date):
+                continue
+            if check_in_date is not None and entry["max_check_out"] <= check_in_date:
+                continue
+            self.materialize(month)
+
+    def next_reservation_id(self):
+        if self.lazy:
+            return self.data['next_reservation_id']
+        return len(self.reservations) + 1
+
+    def index_reservation(self, reservation):
+        try:
+            reservation.check_in_date, reservation.check_out_date = normalize_stay(reservation.check_in_date, reservation.check_out_date)
+        except (TypeError, ValueError) as e:
+            self.stay_problems.append((reservation.reservation_id, str(e)))
+            return
+        calendar = self.calendars.setdefault(reservation.room_number, RoomCalendar())
+        conflicting_id = calendar.conflict(reservation.check_in_date, reservation.check_out_date)
+        if conflicting_id is not None:
+            self.stay_problems.append((reservation.reservation_id, f"Overlaps reservation {conflicting_id}"))
+        calendar.add(reservation.check_in_date, reservation.check_out_date, reservation.reservation_id)
+
+    def capture(self):
+        # Rooms, guests and reservations are never modified once created and their
+        # lists only grow, so list lengths taken under the lock (plus copies of the
+        # small mutable parts) are a consistent image that can be serialized later
+        # while mutations carry on
+        with self.lock:
+            data = {key: value for key, value in self.data.items() if key not in ('rooms', 'guests', 'reservations', 'segments')}
+            counts = (len(self.rooms), len(self.guests), len(self.reservations))
+            segments = {}
+            if self.lazy:
+                data['segments'] = {month: dict(entry) for month, entry in self.manifest.items()}
+                segments = {month: len(self.segments[month]) for month in self.dirty_segments}
+                self.dirty_segments.clear()
+            data['change_seq'] = self.change_seq
+            return data, counts, segments
 
     def save(self):
-        self.data['rooms'] = [r.to_dict() for r in self.rooms]
-        self.data['guests'] = [g.to_dict() for g in self.guests]
-        self.data['reservations'] = [r.to_dict() for r in self.reservations]
-        save_data(self.data)
+        with self.save_lock:
+            data, (room_count, guest_count, reservation_count), segments = self.capture()
+            try:
+                data['rooms'] = [r.to_dict() for r in self.rooms[:room_count]]
+                data['guests'] = [g.to_dict() for g in self.guests[:guest_count]]
+                if self.lazy:
+                    for month, count in segments.items():
+                        save_segment(month, [r.to_dict() for r in self.segments[month][:count]])
+                    data['reservations'] = []
+                else:
+                    data['reservations'] = [r.to_dict() for r in self.reservations[:reservation_count]]
+                save_data(data)
+            except OSError:
+                if self.lazy:
+                    with self.lock:
+                        self.dirty_segments.update(segments)
+                raise
+            with self.lock:
+                self.snapshot_seq = data['change_seq']
+                self.pending_changes = [(seq, line) for seq, line in self.pending_changes if seq > self.snapshot_seq]
+                if self.journal_entries:
+                    rewrite_journal([line for _, line in self.pending_changes])
+                    self.journal_entries = len(self.pending_changes)
+
+    def snapshot_loop(self):
+        while not self.stop_event.wait(self.snapshot_interval):
+            if self.change_seq != self.snapshot_seq:
+                try:
+                    self.save()
+                except OSError as e:
+                    print(f"Snapshot failed, will retry: {e}", file=sys.stderr)
+
+    def close(self):
+        if self.background:
+            self.stop_event.set()
+            self.snapshot_thread.join()
+        if self.change_seq != self.snapshot_seq:
+            self.save()
+
+    def replay_journal(self):
+        for entry in load_journal():
+            self.journal_entries += 1
+            if entry['seq'] <= self.change_seq:
+                continue
+            self.apply(entry)
+            self.change_seq = entry['seq']
+            self.pending_changes.append((entry['seq'], json.dumps(entry, separators=(',', ':')) + '\n'))
+
+    def apply(self, entry):
+        op = entry['op']
+        if op == 'add_room':
+            room = Room.from_dict(entry['room'])
+            self.rooms.append(room)
+            self.calendars.setdefault(room.room_number, RoomCalendar())
+        elif op == 'add_guest':
+            guest = Guest.from_dict(entry['guest'])
+            self.guests.append(guest)
+            self.guests_by_id[guest.guest_id] = guest
+        elif op == 'create_reservation':
+            self.replay_reservation(Reservation.from_dict(entry['reservation']))
+        elif op == 'create_group_reservation':
+            for record in entry['reservations']:
+                self.replay_reservation(Reservation.from_dict(record))
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    def replay_reservation(self, reservation):
+        if self.lazy and self.segment_holds(reservation):
+            # Segment files are written before the data file, so a snapshot cut
+            # short in between leaves the stay stored but missing from the manifest
+            self.track_segment(reservation)
+            self.data['next_reservation_id'] = max(self.data['next_reservation_id'], reservation.reservation_id + 1)
+        else:
+            self.store_reservation(reservation)
+
+    def commit(self, op, **payload):
+        if self.background:
+            self.change_seq += 1
+            line = json.dumps(dict(payload, op=op, seq=self.change_seq), separators=(',', ':')) + '\n'
+            append_journal(line)
+            self.pending_changes.append((self.change_seq, line))
+            self.journal_entries += 1
+        elif self.autosave:
+            self.save()
 
     def add_room(self, room_number, room_type, price_per_night):
-        room = Room(room_number, room_type, price_per_night)
-        self.rooms.append(room)
-        self.save()
+        with self.lock:
+            room = Room(room_number, room_type, price_per_night)
+            self.rooms.append(room)
+            self.calendars.setdefault(room_number, RoomCalendar())
+            self.commit('add_room', room=room.to_dict())
         return room
 
     def add_guest(self, name, age):
-        guest_id = len(self.guests) + 1
-        guest = Guest(name, age, guest_id)
-        self.guests.append(guest)
-        self.save()
+        with self.lock:
+            guest_id = len(self.guests) + 1
+            guest = Guest(name, age, guest_id)
+            self.guests.append(guest)
+            self.guests_by_id[guest_id] = guest
+            self.commit('add_guest', guest=guest.to_dict())
         return guest
 
     def create_reservation(self, room_number, guest_id, check_in_date, check_out_date):
-        reservation_id = len(self.reservations) + 1
-        if not any(r.room_number == room_number for r in self.rooms):
-            raise ValueError("Room number does not exist")
-        if not any(g.guest_id == guest_id for g in self.guests):
-            raise ValueError("Guest ID does not exist")
-        reservation = Reservation(reservation_id, room_number, guest_id, check_in_date, check_out_date)
-        self.reservations.append(reservation)
-        self.save()
+        with self.lock:
+            calendar = self.calendars.get(room_number)
+            if calendar is None:
+                raise ValueError("Room number does not exist")
+            if guest_id not in self.guests_by_id:
+                raise ValueError("Guest ID does not exist")
+            check_in_date, check_out_date = validate_stay(check_in_date, check_out_date)
+            self.load_reservations(check_in_date, check_out_date)
+            reservation_id = self.next_reservation_id()
+            conflicting_id = calendar.conflict(check_in_date, check_out_date)
+            if conflicting_id is not None:
+                raise ValueError(f"Room is already booked for these dates (reservation {conflicting_id})")
+            reservation = Reservation(reservation_id, room_number, guest_id, check_in_date, check_out_date)
+            self.store_reservation(reservation)
+            self.commit('create_reservation', reservation=reservation.to_dict())
+        for listener in self.reservation_listeners:
+            listener(reservation)
         return reservation
 
+    def segment_holds(self, reservation):
+        month = stay_month(reservation.check_in_date)
+        if month in self.manifest and month not in self.segments:
+            self.materialize(month)
+        return any(r.reservation_id == reservation.reservation_id for r in self.segments.get(month, []))
+
+    def create_group_reservation(self, items):
+        # items are (room_number, guest_id, check_in_date, check_out_date) tuples.
+        # Every item is checked against the existing bookings and against the
+        # earlier items of the group; the group is stored with a single commit
+        # only if all of them pass.
+        with self.lock:
+            stays = []
+            errors = []
+            for index, item in enumerate(items):
+                try:
+                    if not isinstance(item, (tuple, list)) or len(item) != 4:
+                        raise ValueError("Expected (room_number, guest_id, check_in_date, check_out_date)")
+                    room_number, guest_id, check_in_date, check_out_date = item
+                    if room_number not in self.calendars:
+                        raise ValueError("Room number does not exist")
+                    if guest_id not in self.guests_by_id:
+                        raise ValueError("Guest ID does not exist")
+                    stays.append((index, room_number, guest_id) + validate_stay(check_in_date, check_out_date))
+                except (TypeError, ValueError) as e:
+                    errors.append((index, str(e)))
+            if stays:
+                self.load_reservations(min(stay[3] for stay in stays), max(stay[4] for stay in stays))
+            # Items accepted so far, per room, with their item index in place of a reservation ID
+            block = {}
+            for index, room_number, guest_id, check_in_date, check_out_date in stays:
+                conflicting_id = self.calendars[room_number].conflict(check_in_date, check_out_date)
+                if conflicting_id is not None:
+                    errors.append((index, f"Room is already booked for these dates (reservation {conflicting_id})"))
+                    continue
+                block_calendar = block.setdefault(room_number, RoomCalendar())
+                conflicting_index = block_calendar.conflict(check_in_date, check_out_date)
+                if conflicting_index is not None:
+                    errors.append((index, f"Overlaps item {conflicting_index} of this group"))
+                    continue
+                block_calendar.add(check_in_date, check_out_date, index)
+            if errors:
+                raise GroupBookingError(sorted(errors), len(items))
+            reservation_id = self.next_reservation_id()
+            reservations = []
+            for offset, (index, room_number, guest_id, check_in_date, check_out_date) in enumerate(stays):
+                reservation = Reservation(reservation_id + offset, room_number, guest_id, check_in_date, check_out_date)
+                self.store_reservation(reservation)
+                reservations.append(reservation)
+            if reservations:
+                self.commit('create_group_reservation', reservations=[r.to_dict() for r in reservations])
+        for reservation in reservations:
+            for listener in self.reservation_listeners:
+                listener(reservation)
+        return reservations
+
+    def store_reservation(self, reservation):
+        self.reservations.append(reservation)
+        self.index_reservation(reservation)
+        if self.lazy:
+            month = stay_month(reservation.check_in_date)
+            # The month's segment file is rewritten whole on save, so it must be
+            # loaded first even when none of its stays overlap this one
+            if month in self.manifest and month not in self.segments:
+                self.materialize(month)
+            self.segments.setdefault(month, []).append(reservation)
+            self.track_segment(reservation)
+            self.data['next_reservation_id'] = reservation.reservation_id + 1
+
+    def find_available_rooms(self, check_in_date, check_out_date, room_type=None):
+        check_in_date, check_out_date = validate_stay(check_in_date, check_out_date)
+        self.load_reservations(check_in_date, check_out_date)
+        return [
+            r.to_dict() for r in self.rooms
+            if (room_type is None or r.room_type == room_type)
+            and self.calendars[r.room_number].is_free(check_in_date, check_out_date)
+        ]
+
     def get_room_info(self, room_number):
         room = next((r for r in self.rooms if r.room_number == room_number), None)
         if not room:
@@ -113,13 +563,18 @@ class HotelManagementSystem:
         return room.to_dict()
 
     def get_guest_info(self, guest_id):
-        guest = next((g for g in self.guests if g.guest_id == guest_id), None)
+        guest = self.guests_by_id.get(guest_id)
         if not guest:
             raise ValueError("Guest not found")
         return guest.to_dict()
 
     def get_reservation_info(self, reservation_id):
         reservation = next((r for r in self.reservations if r.reservation_id == reservation_id), None)
+        if not reservation and self.lazy:
+            for month, entry in list(self.manifest.items()):
+                if month not in self.segments and entry["min_id"] <= reservation_id <= entry["max_id"]:
+                    self.materialize(month)
+            reservation = next((r for r in self.reservations if r.reservation_id == reservation_id), None)
         if not reservation:
             raise ValueError("Reservation not found")
         reservation_info = reservation.to_dict()
@@ -136,10 +591,14 @@ def display_menu():
     print("4. Get Room Info")
     print("5. Get Guest Info")
     print("6. Get Reservation Info")
-    print("7. Exit")
+    print("7. Find Available Rooms")
+    print("8. Create Group Reservation")
+    print("9. Exit")
 
 def main():
-    hms = HotelManagementSystem()
+    hms = HotelManagementSystem(lazy=True, background=True)
+    for reservation_id, problem in hms.stay_problems:
+        print(f"Warning: stored reservation {reservation_id}: {problem}")
     
     while True:
         display_menu()
@@ -194,6 +653,36 @@ def main():
                 print(e)
         
         elif choice == '7':
+            check_in_date = input("Enter check-in date (YYYY-MM-DD): ")
+            check_out_date = input("Enter check-out date (YYYY-MM-DD): ")
+            room_type = input("Enter room type (leave blank for any): ") or None
+            try:
+                rooms = hms.find_available_rooms(check_in_date, check_out_date, room_type)
+                print(f"Available Rooms: {rooms}")
+            except ValueError as e:
+                print(e)
+        
+        elif choice == '8':
+            print("Enter one stay per line as room number, guest ID, check-in, check-out (blank line to finish):")
+            items = []
+            while True:
+                line = input()
+                if not line.strip():
+                    break
+                fields = [field.strip() for field in line.split(',')]
+                if len(fields) == 4 and fields[1].isdigit():
+                    fields[1] = int(fields[1])
+                items.append(tuple(fields))
+            try:
+                reservations = hms.create_group_reservation(items)
+                print(f"Created {len(reservations)} reservations: {[r.reservation_id for r in reservations]}")
+            except GroupBookingError as e:
+                print(f"{len(e.errors)} of {len(items)} stays failed, nothing was booked:")
+                for index, message in e.errors:
+                    print(f"  Line {index + 1}: {message}")
+
+        elif choice == '9':
+            hms.close()
             print("Exiting the program.")
             break
         
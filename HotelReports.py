@@ -0,0 +1,135 @@
+import sys
+from array import array
+from datetime import date, datetime
+
+import numpy as np
+
+from Hotel import HotelManagementSystem
+
+def to_day(text):
+    try:
+        return date.fromisoformat(text).toordinal()
+    except ValueError:
+        # Reservations stored before dates were validated may not be zero-padded
+        return datetime.strptime(text, '%Y-%m-%d').toordinal()
+
+# Occupancy and revenue reporting. Reservations are flattened once into typed
+# columns (check-in and check-out as day numbers, nightly price, room type code),
+# which are then appended to as new reservations are created. Queries run as
+# NumPy operations over zero-copy views of those columns.
+class OccupancyReport:
+    def __init__(self, hms):
+        self.hms = hms
+        self.check_in_days = array('i')
+        self.check_out_days = array('i')
+        self.prices = array('d')
+        self.type_codes = array('i')
+        self.room_types = []
+        self.type_index = {}
+        self.rooms_by_number = {}
+        hms.load_reservations()
+        for reservation in hms.reservations:
+            self.add(reservation)
+        hms.reservation_listeners.append(self.add)
+
+    def close(self):
+        self.hms.reservation_listeners.remove(self.add)
+
+    def room(self, room_number):
+        room = self.rooms_by_number.get(room_number)
+        if room is None:
+            self.rooms_by_number = {r.room_number: r for r in self.hms.rooms}
+            room = self.rooms_by_number[room_number]
+        return room
+
+    def add(self, reservation):
+        room = self.room(reservation.room_number)
+        code = self.type_index.get(room.room_type)
+        if code is None:
+            code = self.type_index[room.room_type] = len(self.room_types)
+            self.room_types.append(room.room_type)
+        self.check_in_days.append(to_day(reservation.check_in_date))
+        self.check_out_days.append(to_day(reservation.check_out_date))
+        self.prices.append(float(room.price_per_night))
+        self.type_codes.append(code)
+
+    def columns(self):
+        return (
+            np.frombuffer(self.check_in_days, dtype=self.check_in_days.typecode),
+            np.frombuffer(self.check_out_days, dtype=self.check_out_days.typecode),
+            np.frombuffer(self.prices, dtype=self.prices.typecode),
+            np.frombuffer(self.type_codes, dtype=self.type_codes.typecode),
+        )
+
+    @staticmethod
+    def date_range(start, end):
+        start_day, end_day = to_day(start), to_day(end)
+        if end_day <= start_day:
+            raise ValueError("End date must be after start date")
+        return start_day, end_day
+
+    def nights_sold(self, start_day, end_day):
+        # Nights each reservation contributes to [start_day, end_day)
+        check_ins, check_outs, _, _ = self.columns()
+        return np.clip(np.minimum(check_outs, end_day) - np.maximum(check_ins, start_day), 0, None)
+
+    def occupancy(self, start, end):
+        # Share of rooms occupied on each night in [start, end)
+        start_day, end_day = self.date_range(start, end)
+        nights = end_day - start_day
+        check_ins, check_outs, _, _ = self.columns()
+        first = np.clip(check_ins - start_day, 0, nights)
+        last = np.clip(check_outs - start_day, 0, nights)
+        overlapping = last > first
+        changes = (np.bincount(first[overlapping], minlength=nights + 1)
+                   - np.bincount(last[overlapping], minlength=nights + 1))
+        occupied = np.cumsum(changes)[:nights]
+        room_count = len(self.hms.rooms)
+        rates = occupied / room_count if room_count else np.zeros(nights)
+        return {date.fromordinal(start_day + i).isoformat(): float(rate) for i, rate in enumerate(rates)}
+
+    def revenue(self, start, end):
+        start_day, end_day = self.date_range(start, end)
+        _, _, prices, _ = self.columns()
+        return float(np.dot(self.nights_sold(start_day, end_day), prices))
+
+    def revenue_by_room_type(self, start, end):
+        start_day, end_day = self.date_range(start, end)
+        _, _, prices, type_codes = self.columns()
+        totals = np.bincount(type_codes, weights=self.nights_sold(start_day, end_day) * prices,
+                             minlength=len(self.room_types))
+        return {room_type: float(total) for room_type, total in zip(self.room_types, totals)}
+
+    def summary(self, start, end):
+        # ADR is revenue per room-night sold; RevPAR is revenue per room-night available
+        start_day, end_day = self.date_range(start, end)
+        _, _, prices, _ = self.columns()
+        nights_sold = self.nights_sold(start_day, end_day)
+        revenue = float(np.dot(nights_sold, prices))
+        room_nights_sold = int(nights_sold.sum())
+        room_nights_available = len(self.hms.rooms) * (end_day - start_day)
+        return {
+            "revenue": revenue,
+            "room_nights_sold": room_nights_sold,
+            "room_nights_available": room_nights_available,
+            "occupancy_rate": room_nights_sold / room_nights_available if room_nights_available else 0.0,
+            "adr": revenue / room_nights_sold if room_nights_sold else 0.0,
+            "revpar": revenue / room_nights_available if room_nights_available else 0.0,
+        }
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python HotelReports.py START_DATE END_DATE")
+        return
+    start, end = sys.argv[1], sys.argv[2]
+    report = OccupancyReport(HotelManagementSystem(lazy=True))
+    try:
+        print(f"Summary: {report.summary(start, end)}")
+        print(f"Revenue by room type: {report.revenue_by_room_type(start, end)}")
+        for night, rate in report.occupancy(start, end).items():
+            print(f"{night}: {rate:.1%}")
+    except ValueError as e:
+        print(e)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import sys
+
+from Hotel import HotelManagementSystem
+
+# Server settings
+HOST = '127.0.0.1'
+PORT = 8765
+MAX_BATCH = 1000
+RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 30.0
+
+# Line protocol: each request is one JSON object per line,
+#   {"id": 1, "op": "create_reservation", "args": {"room_number": "101", ...}}
+# and each response is one JSON line echoing the id,
+#   {"id": 1, "ok": true, "result": {...}} or {"id": 1, "ok": false, "error": "..."}
+MUTATIONS = {'add_room', 'add_guest', 'create_reservation', 'create_group_reservation'}
+QUERIES = {'get_room_info', 'get_guest_info', 'get_reservation_info', 'find_available_rooms'}
+
+def to_result(value):
+    if isinstance(value, list):
+        return [to_result(item) for item in value]
+    return value.to_dict() if hasattr(value, 'to_dict') else value
+
+# Reads are answered straight from memory on the event loop. Mutations are queued
+# to a single writer task, which applies everything queued so far, writes it with
+# one save() and only then answers the clients (group commit). Applied mutations
+# cannot be taken back, so a failed save is retried until it succeeds rather than
+# reported as a failure of changes that the next save would persist anyway.
+class HotelServer:
+    def __init__(self, hms, max_batch=MAX_BATCH):
+        self.hms = hms
+        self.hms.autosave = False
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+
+    async def serve(self, host=HOST, port=PORT):
+        writer_task = asyncio.create_task(self.write_loop())
+        server = await asyncio.start_server(self.handle_client, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            writer_task.cancel()
+            self.hms.save()
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.dispatch(line)
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, line):
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            op = request['op']
+            args = request.get('args', {})
+        except (ValueError, KeyError, AttributeError):
+            return {"id": None, "ok": False, "error": "Malformed request"}
+        if op in QUERIES:
+            try:
+                return {"id": request_id, "ok": True, "result": to_result(getattr(self.hms, op)(**args))}
+            except (ValueError, TypeError) as e:
+                return {"id": request_id, "ok": False, "error": str(e)}
+        if op in MUTATIONS:
+            future = asyncio.get_running_loop().create_future()
+            await self.queue.put((op, args, future))
+            ok, result = await future
+            if ok:
+                return {"id": request_id, "ok": True, "result": result}
+            return {"id": request_id, "ok": False, "error": result}
+        return {"id": request_id, "ok": False, "error": f"Unknown operation: {op}"}
+
+    async def write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            outcomes = []
+            for op, args, future in batch:
+                try:
+                    outcomes.append((future, True, to_result(getattr(self.hms, op)(**args))))
+                except (ValueError, TypeError) as e:
+                    outcomes.append((future, False, str(e)))
+                except Exception as e:
+                    # Such as an OSError loading a reservation segment; the writer
+                    # keeps serving the rest of the batch and later ones
+                    print(f"{op} failed: {e!r}", file=sys.stderr)
+                    outcomes.append((future, False, f"Internal error: {e}"))
+            if any(ok for _, ok, _ in outcomes):
+                await self.commit(loop)
+            for future, ok, result in outcomes:
+                if not future.done():
+                    future.set_result((ok, result))
+
+    async def commit(self, loop):
+        delay = RETRY_DELAY
+        while True:
+            try:
+                # The writer is the only mutator and waits here, so the state
+                # being saved cannot change underneath the save thread
+                await loop.run_in_executor(None, self.hms.save)
+                return
+            except OSError as e:
+                print(f"Commit failed, retrying in {delay:g}s: {e}", file=sys.stderr)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    server = HotelServer(HotelManagementSystem(lazy=True))
+    print(f"Hotel server listening on {HOST}:{port}")
+    try:
+        asyncio.run(server.serve(HOST, port))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+
+if __name__ == "__main__":
+    main()
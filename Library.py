@@ -1,9 +1,196 @@
+import functools
+import heapq
 import json
 import os
-from datetime import datetime
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+from datetime import date, datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # Data Storage
 DATA_FILE = 'library_data.json'
+JOURNAL_FILE = 'library_data.journal'
+CHECKPOINT_INTERVAL = 1000
+INDEX_FILE = 'library_index.json'
+LOAN_PERIOD_DAYS = 14
+PROFILE_FILE = 'library_profile.json'
+ARCHIVE_DIR = 'library_archive'
+ARCHIVE_AFTER_DAYS = 180
+ARCHIVE_CACHE_SHARDS = 12
+
+# Opt-in profiler. While PROFILER is None every instrumented call costs a single
+# global lookup; enable_profiling() installs a Profiler that collects per-operation
+# latency histograms, I/O timings and byte counts, and linear scan lengths.
+PROFILER = None
+
+class Profiler:
+    def __init__(self):
+        self.started = time.time()
+        self.operations = {}
+        self.io = {}
+        self.scans = {}
+
+    def record_call(self, name, seconds, failed):
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0, "histogram": {}}
+        stats['count'] += 1
+        stats['errors'] += failed
+        stats['total_seconds'] += seconds
+        stats['max_seconds'] = max(stats['max_seconds'], seconds)
+        # Power-of-two microsecond buckets: bucket b holds calls under 2**b us
+        bucket = int(seconds * 1e6).bit_length()
+        stats['histogram'][bucket] = stats['histogram'].get(bucket, 0) + 1
+
+    def record_io(self, name, **amounts):
+        stats = self.io.setdefault(name, {"count": 0})
+        stats['count'] += 1
+        for key, amount in amounts.items():
+            stats[key] = stats.get(key, 0) + amount
+
+    def counting(self, name, items):
+        # Yields items unchanged while counting how many a linear lookup visits
+        stats = self.scans.setdefault(name, {"lookups": 0, "records_scanned": 0})
+        stats['lookups'] += 1
+        for item in items:
+            stats['records_scanned'] += 1
+            yield item
+
+    def to_dict(self):
+        operations = {}
+        for name, stats in self.operations.items():
+            operations[name] = dict(
+                stats,
+                mean_seconds=stats['total_seconds'] / stats['count'],
+                histogram={f"<{2 ** bucket}us": count for bucket, count in sorted(stats['histogram'].items())},
+            )
+        return {
+            "started": self.started,
+            "elapsed_seconds": time.time() - self.started,
+            "operations": operations,
+            "io": self.io,
+            "scans": self.scans,
+        }
+
+    def report(self):
+        lines = [f"{'Operation':<24}{'Calls':>8}{'Errors':>8}{'Mean ms':>10}{'Max ms':>10}"]
+        for name, stats in sorted(self.operations.items()):
+            lines.append(f"{name:<24}{stats['count']:>8}{stats['errors']:>8}"
+                         f"{stats['total_seconds'] / stats['count'] * 1000:>10.3f}{stats['max_seconds'] * 1000:>10.3f}")
+        for name, stats in sorted(self.io.items()):
+            lines.append(f"{name}: " + ", ".join(f"{key}={value:.4f}" if isinstance(value, float) else f"{key}={value}"
+                                                 for key, value in stats.items()))
+        for name, stats in sorted(self.scans.items()):
+            lines.append(f"{name} scans: {stats['lookups']} lookups, {stats['records_scanned']} records scanned")
+        return "\n".join(lines)
+
+def enable_profiling():
+    global PROFILER
+    if PROFILER is None:
+        PROFILER = Profiler()
+    return PROFILER
+
+def disable_profiling():
+    global PROFILER
+    profiler, PROFILER = PROFILER, None
+    return profiler
+
+def dump_profile(path=PROFILE_FILE):
+    with open(path, 'w') as f:
+        json.dump(PROFILER.to_dict(), f, indent=4)
+
+def profiled(method):
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if PROFILER is None:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = method(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            if PROFILER is not None:
+                PROFILER.record_call(name, time.perf_counter() - start, failed)
+    return wrapper
+
+def scanned(name, items):
+    return items if PROFILER is None else PROFILER.counting(name, items)
+
+# Serialization codecs for the data file. Every codec turns the data dict into
+# bytes and back; orjson and msgpack are only offered when they are installed.
+class JsonCodec:
+    def __init__(self, name, indent=None):
+        self.name = name
+        self.indent = indent
+        self.separators = None if indent else (',', ':')
+
+    def dumps(self, data):
+        return json.dumps(data, indent=self.indent, separators=self.separators).encode()
+
+    def loads(self, payload):
+        return json.loads(payload)
+
+class OrjsonCodec:
+    name = 'orjson'
+
+    def dumps(self, data):
+        return orjson.dumps(data)
+
+    def loads(self, payload):
+        return orjson.loads(payload)
+
+class MsgpackCodec:
+    name = 'msgpack'
+
+    def dumps(self, data):
+        return msgpack.packb(data)
+
+    def loads(self, payload):
+        return msgpack.unpackb(payload, strict_map_key=False)
+
+CODECS = {'pretty': JsonCodec('pretty', indent=4), 'compact': JsonCodec('compact')}
+if orjson is not None:
+    CODECS['orjson'] = OrjsonCodec()
+if msgpack is not None:
+    CODECS['msgpack'] = MsgpackCodec()
+DEFAULT_CODEC = 'orjson' if orjson is not None else 'compact'
+
+def get_codec(name):
+    codec = CODECS.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown or unavailable codec: {name} (available: {', '.join(CODECS)})")
+    return codec
+
+def detect_codec(payload):
+    # A JSON file starts with '{' or '[' (possibly after whitespace); a msgpack
+    # file starts with a map or array header byte. Either JSON layout is parsed
+    # the fastest way.
+    if payload.lstrip()[:1] in (b'{', b'['):
+        return CODECS.get('orjson', CODECS['compact'])
+    if msgpack is None:
+        raise ValueError("Data file is not JSON and msgpack is not installed")
+    return CODECS['msgpack']
 
 # Initialize data storage if it does not exist
 if not os.path.exists(DATA_FILE):
@@ -11,28 +198,204 @@ if not os.path.exists(DATA_FILE):
         json.dump({"books": [], "members": [], "transactions": []}, f)
 
 # Helper functions to load and save data
-def load_data():
-    with open(DATA_FILE, 'r') as f:
-        return json.load(f)
+def load_data(path=DATA_FILE):
+    if PROFILER is None:
+        with open(path, 'rb') as f:
+            payload = f.read()
+        return detect_codec(payload).loads(payload)
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        payload = f.read()
+    read_done = time.perf_counter()
+    data = detect_codec(payload).loads(payload)
+    PROFILER.record_io('load_data', read_seconds=read_done - start, parse_seconds=time.perf_counter() - read_done,
+                       bytes_read=len(payload))
+    return data
 
-def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
+def save_data(data, codec=DEFAULT_CODEC, path=DATA_FILE):
+    # Written to a temporary file and renamed, so a crash during a checkpoint
+    # never leaves a truncated snapshot behind
+    codec = get_codec(codec)
+    tmp_file = path + '.tmp'
+    if PROFILER is None:
+        payload = codec.dumps(data)
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, path)
+        return
+    start = time.perf_counter()
+    payload = codec.dumps(data)
+    serialized = time.perf_counter()
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, path)
+    PROFILER.record_io('save_data', serialize_seconds=serialized - start, write_seconds=time.perf_counter() - serialized,
+                       bytes_written=len(payload))
+
+def convert_data_file(codec, source=DATA_FILE, destination=None):
+    # Rewrites a data file with another codec; save_data goes through a
+    # temporary file, so converting in place never leaves the original half-written
+    destination = destination or source
+    save_data(load_data(source), codec, destination)
+    return os.path.getsize(destination)
+
+# Helper functions for the append-only journal (one compact JSON record per line)
+def append_journal(entry):
+    line = json.dumps(entry, separators=(',', ':')) + '\n'
+    with open(JOURNAL_FILE, 'a') as f:
+        f.write(line)
+    if PROFILER is not None:
+        PROFILER.record_io('append_journal', bytes_written=len(line.encode()))
+
+def load_journal():
+    if not os.path.exists(JOURNAL_FILE):
+        return []
+    entries = []
+    with open(JOURNAL_FILE, 'r') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append; nothing after it was committed
+                break
+    return entries
+
+def clear_journal():
+    with open(JOURNAL_FILE, 'w'):
+        pass
+
+# Archive of returned loans: one immutable shard file per return month and
+# archival pass (YYYY-MM.<part>.json), listed in the data file's 'archive' manifest
+def archive_path(name):
+    return os.path.join(ARCHIVE_DIR, name)
+
+def write_archive_shard(name, records, codec=DEFAULT_CODEC):
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    save_data(records, codec, archive_path(name))
+
+# Shards never change once written, so recently read ones can be cached as is
+@functools.lru_cache(maxsize=ARCHIVE_CACHE_SHARDS)
+def load_archive_shard(name):
+    return load_data(archive_path(name))
+
+# Catalogue search index
+TOKEN_PATTERN = re.compile(r'\w+')
+TITLE_WEIGHT = 2.0
+AUTHOR_WEIGHT = 3.0
+ISBN_WEIGHT = 5.0
+PREFIX_PENALTY = 0.5
+MAX_PREFIX_TERMS = 64
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+def normalize_isbn(isbn):
+    return ''.join(c for c in str(isbn).upper() if c.isdigit() or c == 'X')
+
+# Inverted index over book titles and authors, plus a sorted ISBN list for prefix
+# lookups. Postings map a token to {book_id: weight}; the sorted term list lets
+# the last query token match as a prefix.
+class CatalogueIndex:
+    def __init__(self):
+        self.postings = {}
+        self.terms = []
+        self.isbns = []
+        self.book_count = 0
+        self.last_book_id = 0
+
+    def add(self, book):
+        for text, weight in ((book.title, TITLE_WEIGHT), (book.author, AUTHOR_WEIGHT)):
+            for token in tokenize(text):
+                posting = self.postings.get(token)
+                if posting is None:
+                    posting = self.postings[token] = {}
+                    insort(self.terms, token)
+                posting[book.book_id] = posting.get(book.book_id, 0) + weight
+        isbn = normalize_isbn(book.isbn)
+        if isbn:
+            insort(self.isbns, (isbn, book.book_id))
+        self.book_count += 1
+        self.last_book_id = book.book_id
+
+    def prefix_terms(self, prefix):
+        i = bisect_left(self.terms, prefix)
+        matches = []
+        while i < len(self.terms) and self.terms[i].startswith(prefix) and len(matches) < MAX_PREFIX_TERMS:
+            matches.append(self.terms[i])
+            i += 1
+        return matches
+
+    def search(self, query, limit):
+        # Books are ranked first by how many query tokens they match, then by score
+        tokens = tokenize(query)
+        scores = {}
+        hits = {}
+        for position, token in enumerate(tokens):
+            best = {}
+            terms = self.prefix_terms(token) if position == len(tokens) - 1 else [token]
+            for term in terms:
+                factor = 1.0 if term == token else PREFIX_PENALTY
+                for book_id, weight in self.postings.get(term, {}).items():
+                    if weight * factor > best.get(book_id, 0):
+                        best[book_id] = weight * factor
+            for book_id, score in best.items():
+                scores[book_id] = scores.get(book_id, 0) + score
+                hits[book_id] = hits.get(book_id, 0) + 1
+        isbn = normalize_isbn(query)
+        if len(isbn) >= 3 and len(isbn) * 2 >= len(query.strip()):
+            i = bisect_left(self.isbns, (isbn,))
+            while i < len(self.isbns) and self.isbns[i][0].startswith(isbn):
+                book_id = self.isbns[i][1]
+                scores[book_id] = scores.get(book_id, 0) + ISBN_WEIGHT
+                hits[book_id] = max(hits.get(book_id, 0), len(tokens))
+                i += 1
+        return heapq.nlargest(limit, scores, key=lambda book_id: (hits[book_id], scores[book_id], -book_id))
+
+    def to_dict(self):
+        return {
+            "book_count": self.book_count,
+            "last_book_id": self.last_book_id,
+            "postings": {token: [x for item in posting.items() for x in item] for token, posting in self.postings.items()},
+            "isbns": self.isbns,
+        }
+
+    @staticmethod
+    def from_dict(data):
+        index = CatalogueIndex()
+        index.book_count = data['book_count']
+        index.last_book_id = data['last_book_id']
+        index.postings = {token: dict(zip(flat[::2], flat[1::2])) for token, flat in data['postings'].items()}
+        index.terms = sorted(index.postings)
+        index.isbns = [tuple(entry) for entry in data['isbns']]
+        return index
+
+def load_index():
+    if not os.path.exists(INDEX_FILE):
+        return None
+    with open(INDEX_FILE, 'r') as f:
+        return CatalogueIndex.from_dict(json.load(f))
+
+def save_index(index):
+    tmp_file = INDEX_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(index.to_dict(), f, separators=(',', ':'))
+    os.replace(tmp_file, INDEX_FILE)
 
 # Book management
 class Book:
-    def __init__(self, title, author, isbn, book_id):
+    def __init__(self, title, author, isbn, book_id, copies=1):
         self.title = title
         self.author = author
         self.isbn = isbn
         self.book_id = book_id
+        self.copies = copies
 
     def to_dict(self):
-        return {"title": self.title, "author": self.author, "isbn": self.isbn, "book_id": self.book_id}
+        return {"title": self.title, "author": self.author, "isbn": self.isbn, "book_id": self.book_id, "copies": self.copies}
 
     @staticmethod
     def from_dict(data):
-        return Book(data['title'], data['author'], data['isbn'], data['book_id'])
+        return Book(data['title'], data['author'], data['isbn'], data['book_id'], data.get('copies', 1))
 
 # Member management
 class Member:
@@ -69,67 +432,513 @@ class Transaction:
     def from_dict(data):
         return Transaction(data['transaction_id'], data['book_id'], data['member_id'], data['borrow_date'], data.get('return_date'))
 
+# Columnar transaction store: parallel typed arrays, with dates held as day
+# numbers (proleptic ordinals) and NO_DATE marking a loan that is still open
+NO_DATE = -1
+
+def to_day(text):
+    if not text:
+        return NO_DATE
+    try:
+        return date.fromisoformat(text).toordinal()
+    except ValueError:
+        raise ValueError("Dates must be in YYYY-MM-DD format")
+
+def from_day(day):
+    return date.fromordinal(day).isoformat() if day != NO_DATE else None
+
+def check_date(text):
+    # Dates are stored as given, so they are checked on the way in
+    if not isinstance(text, str) or to_day(text) == NO_DATE:
+        raise ValueError("Dates must be in YYYY-MM-DD format")
+    return text
+
+# A view of one row of a TransactionColumns store that behaves like a Transaction
+class TransactionRow:
+    __slots__ = ('columns', 'index')
+
+    def __init__(self, columns, index):
+        self.columns = columns
+        self.index = index
+
+    @property
+    def transaction_id(self):
+        return self.columns.transaction_ids[self.index]
+
+    @property
+    def book_id(self):
+        return self.columns.book_ids[self.index]
+
+    @property
+    def member_id(self):
+        return self.columns.member_ids[self.index]
+
+    @property
+    def borrow_date(self):
+        return from_day(self.columns.borrow_days[self.index])
+
+    @property
+    def return_date(self):
+        return from_day(self.columns.return_days[self.index])
+
+    @return_date.setter
+    def return_date(self, value):
+        self.columns.return_days[self.index] = to_day(value)
+
+    def to_dict(self):
+        return Transaction.to_dict(self)
+
+class TransactionColumns:
+    def __init__(self):
+        self.transaction_ids = array('q')
+        self.book_ids = array('q')
+        self.member_ids = array('q')
+        self.borrow_days = array('i')
+        self.return_days = array('i')
+
+    @staticmethod
+    def from_transactions(transactions):
+        columns = TransactionColumns()
+        for transaction in transactions:
+            columns.append(transaction)
+        return columns
+
+    @staticmethod
+    def from_dicts(records):
+        # Straight from the stored records, without a Transaction per loan
+        columns = TransactionColumns()
+        for record in records:
+            columns.append_values(record['transaction_id'], record['book_id'], record['member_id'],
+                                  record['borrow_date'], record.get('return_date'))
+        return columns
+
+    def append(self, transaction):
+        self.append_values(transaction.transaction_id, transaction.book_id, transaction.member_id,
+                           transaction.borrow_date, transaction.return_date)
+
+    def append_values(self, transaction_id, book_id, member_id, borrow_date, return_date):
+        # Convert the dates first so a malformed date leaves the columns untouched
+        borrow_day = to_day(borrow_date)
+        return_day = to_day(return_date)
+        self.transaction_ids.append(transaction_id)
+        self.book_ids.append(book_id)
+        self.member_ids.append(member_id)
+        self.borrow_days.append(borrow_day)
+        self.return_days.append(return_day)
+
+    def __len__(self):
+        return len(self.transaction_ids)
+
+    def __getitem__(self, index):
+        return TransactionRow(self, index)
+
+    def __iter__(self):
+        return (TransactionRow(self, i) for i in range(len(self.transaction_ids)))
+
+    def find(self, transaction_id):
+        # Transaction IDs are appended in increasing order
+        i = bisect_left(self.transaction_ids, transaction_id)
+        if i < len(self.transaction_ids) and self.transaction_ids[i] == transaction_id:
+            return TransactionRow(self, i)
+        return None
+
+    def overdue(self, as_of, loan_days=LOAN_PERIOD_DAYS):
+        # Loans that were out on as_of and past their due date
+        day = to_day(as_of)
+        if np is not None:
+            borrow_days = np.frombuffer(self.borrow_days, dtype=self.borrow_days.typecode)
+            return_days = np.frombuffer(self.return_days, dtype=self.return_days.typecode)
+            transaction_ids = np.frombuffer(self.transaction_ids, dtype=self.transaction_ids.typecode)
+            mask = (borrow_days + loan_days < day) & ((return_days == NO_DATE) | (return_days > day))
+            return transaction_ids[mask].tolist()
+        return [
+            transaction_id
+            for transaction_id, borrow_day, return_day in zip(self.transaction_ids, self.borrow_days, self.return_days)
+            if borrow_day + loan_days < day and (return_day == NO_DATE or return_day > day)
+        ]
+
+    @staticmethod
+    def count_by(column):
+        if np is not None:
+            counts = np.bincount(np.frombuffer(column, dtype=column.typecode))
+            keys = np.flatnonzero(counts)
+            return dict(zip(keys.tolist(), counts[keys].tolist()))
+        counts = {}
+        for key in column:
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def loans_per_member(self):
+        return self.count_by(self.member_ids)
+
+    def circulation_per_book(self):
+        return self.count_by(self.book_ids)
+
 # Main Library Management System
 class LibraryManagementSystem:
-    def __init__(self):
+    # With archive_after_days set, loans returned more than that many days ago are
+    # moved out of the in-memory transactions into the archive, which is only read
+    # by historical lookups. Journaled systems archive at each checkpoint, others
+    # with the first save of each day.
+    def __init__(self, journaled=False, checkpoint_interval=CHECKPOINT_INTERVAL, columnar=False, codec=DEFAULT_CODEC,
+                 archive_after_days=None):
+        self.journaled = journaled
+        self.checkpoint_interval = checkpoint_interval
+        self.columnar = columnar
+        self.codec = get_codec(codec).name
+        self.archive_after_days = archive_after_days
+        self.archived_on = None
         self.data = load_data()
-        self.books = [Book.from_dict(b) for b in self.data['books']]
-        self.members = [Member.from_dict(m) for m in self.data['members']]
-        self.transactions = [Transaction.from_dict(t) for t in self.data['transactions']]
+        # The stored records are taken out of self.data once converted, so only
+        # the objects (or columns) built from them stay in memory
+        self.books = [Book.from_dict(b) for b in self.data.pop('books')]
+        self.books_by_id = {b.book_id: b for b in self.books}
+        self.members = [Member.from_dict(m) for m in self.data.pop('members')]
+        if columnar:
+            self.transactions = TransactionColumns.from_dicts(self.data.pop('transactions'))
+        else:
+            self.transactions = [Transaction.from_dict(t) for t in self.data.pop('transactions')]
+        self.load_holds()
+        self.journal_seq = self.data.get('journal_seq', 0)
+        self.pending_entries = 0
+        self.replay_journal()
+        # Archived transactions leave the list, so IDs come from a counter
+        self.next_transaction_id = max(
+            self.data.get('next_transaction_id', 1),
+            max((t.transaction_id for t in self.transactions), default=0) + 1,
+        )
+        self.catalogue = self.load_catalogue()
 
+    def load_holds(self):
+        # Copies out per book, counted once here and then kept current, so
+        # availability never depends on the length of the loan history
+        self.loans_out = {}
+        for transaction in self.transactions:
+            if transaction.return_date is None:
+                self.loans_out[transaction.book_id] = self.loans_out.get(transaction.book_id, 0) + 1
+        # Per book, a heap of (priority, seq, member_id) waiting holds; lower
+        # priority is served first, then first come first served. Cancelled holds
+        # are dropped from active_holds and skipped when they reach the top.
+        self.hold_queues = {}
+        self.active_holds = {}
+        self.hold_seq = self.data.get('hold_seq', 0)
+        for hold in self.data.get('holds', []):
+            self.push_hold(hold['book_id'], hold['member_id'], hold['priority'], hold['seq'])
+        # Members each returned copy has been set aside for, per book
+        self.ready_holds = {int(book_id): members for book_id, members in self.data.get('ready_holds', {}).items()}
+
+    def load_catalogue(self):
+        # The persisted index covers the first book_count books; books added since
+        # it was written are indexed now, and a stale index is rebuilt from scratch
+        catalogue = load_index()
+        if catalogue is None or catalogue.book_count > len(self.books) or (
+                catalogue.book_count and self.books[catalogue.book_count - 1].book_id != catalogue.last_book_id):
+            catalogue = CatalogueIndex()
+        self.catalogue_saved_count = catalogue.book_count
+        for book in self.books[catalogue.book_count:]:
+            catalogue.add(book)
+        return catalogue
+
+    def save_catalogue(self):
+        if self.catalogue.book_count != self.catalogue_saved_count:
+            save_index(self.catalogue)
+            self.catalogue_saved_count = self.catalogue.book_count
+
+    @profiled
     def save(self):
-        self.data['books'] = [b.to_dict() for b in self.books]
-        self.data['members'] = [m.to_dict() for m in self.members]
-        self.data['transactions'] = [t.to_dict() for t in self.transactions]
-        save_data(self.data)
+        self.data['holds'] = [
+            {"book_id": book_id, "member_id": member_id, "priority": priority, "seq": seq}
+            for (book_id, member_id), (priority, seq) in self.active_holds.items()
+        ]
+        self.data['ready_holds'] = {str(book_id): members for book_id, members in self.ready_holds.items() if members}
+        self.data['hold_seq'] = self.hold_seq
+        self.data['journal_seq'] = self.journal_seq
+        self.data['next_transaction_id'] = self.next_transaction_id
+        # The records are built for this write only and not kept in self.data
+        data = dict(self.data)
+        data['books'] = [b.to_dict() for b in self.books]
+        data['members'] = [m.to_dict() for m in self.members]
+        data['transactions'] = [t.to_dict() for t in self.transactions]
+        save_data(data, self.codec)
+        # Written after the snapshot, so a crash in between leaves the index
+        # behind the books (caught up on load) rather than ahead of them
+        self.save_catalogue()
+
+    @profiled
+    def checkpoint(self):
+        # Fold the journal into a fresh snapshot. The snapshot records the last applied
+        # sequence number, so a crash before the journal is cleared replays nothing twice.
+        self.archive_returned()
+        self.save()
+        clear_journal()
+        self.pending_entries = 0
 
-    def add_book(self, title, author, isbn):
+    @profiled
+    def archive_returned(self, as_of=None):
+        # Shards are written before the snapshot that drops their loans, so a crash
+        # in between leaves the loans in both places rather than in neither
+        if self.archive_after_days is None:
+            return 0
+        cutoff = to_day(as_of or date.today().isoformat()) - self.archive_after_days
+        keep = []
+        by_month = {}
+        for transaction in self.transactions:
+            try:
+                returned = to_day(transaction.return_date)
+            except ValueError:
+                returned = NO_DATE
+            if returned == NO_DATE or returned >= cutoff:
+                keep.append(transaction)
+            else:
+                by_month.setdefault(from_day(returned)[:7], []).append(transaction.to_dict())
+        if not by_month:
+            return 0
+        manifest = self.data.setdefault('archive', {"shards": [], "loans_per_member": {}, "circulation_per_book": {}})
+        for month, records in sorted(by_month.items()):
+            part = sum(1 for shard in manifest['shards'] if shard['month'] == month)
+            name = f"{month}.{part}.json"
+            write_archive_shard(name, records, self.codec)
+            transaction_ids = [record['transaction_id'] for record in records]
+            manifest['shards'].append({
+                "name": name,
+                "month": month,
+                "count": len(records),
+                "min_id": min(transaction_ids),
+                "max_id": max(transaction_ids),
+            })
+            # Keys are strings because the manifest is stored as JSON
+            for record in records:
+                member_key, book_key = str(record['member_id']), str(record['book_id'])
+                manifest['loans_per_member'][member_key] = manifest['loans_per_member'].get(member_key, 0) + 1
+                manifest['circulation_per_book'][book_key] = manifest['circulation_per_book'].get(book_key, 0) + 1
+        self.transactions = TransactionColumns.from_transactions(keep) if self.columnar else keep
+        return sum(len(records) for records in by_month.values())
+
+    def archive_shards(self):
+        return self.data.get('archive', {}).get('shards', [])
+
+    def find_archived(self, transaction_id):
+        for shard in self.archive_shards():
+            if shard['min_id'] <= transaction_id <= shard['max_id']:
+                for record in load_archive_shard(shard['name']):
+                    if record['transaction_id'] == transaction_id:
+                        return Transaction.from_dict(record)
+        return None
+
+    def with_archived_counts(self, counts, name):
+        for key, count in self.data.get('archive', {}).get(name, {}).items():
+            counts[int(key)] = counts.get(int(key), 0) + count
+        return counts
+
+    def replay_journal(self):
+        for entry in load_journal():
+            if entry['seq'] <= self.journal_seq:
+                continue
+            self.apply(entry)
+            self.journal_seq = entry['seq']
+            self.pending_entries += 1
+
+    def apply(self, entry):
+        op = entry['op']
+        if op == 'add_book':
+            book = Book.from_dict(entry['book'])
+            self.books.append(book)
+            self.books_by_id[book.book_id] = book
+        elif op == 'add_member':
+            self.members.append(Member.from_dict(entry['member']))
+        elif op == 'borrow_book':
+            transaction = Transaction.from_dict(entry['transaction'])
+            self.transactions.append(transaction)
+            self.check_out(transaction.book_id, transaction.member_id)
+        elif op == 'return_book':
+            transaction = self.find_transaction(entry['transaction_id'], 'apply')
+            transaction.return_date = entry['return_date']
+            self.check_in(transaction.book_id)
+        elif op == 'place_hold':
+            self.push_hold(entry['book_id'], entry['member_id'], entry['priority'], entry['seq'])
+            self.allocate(entry['book_id'])
+        elif op == 'cancel_hold':
+            self.drop_hold(entry['book_id'], entry['member_id'])
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    def record(self, op, **payload):
+        self.journal_seq += 1
+        if not self.journaled:
+            # The archive cutoff moves a day at a time, so one pass a day is enough
+            today = date.today().isoformat()
+            if self.archived_on != today:
+                self.archive_returned(today)
+                self.archived_on = today
+            self.save()
+            return
+        append_journal(dict(payload, op=op, seq=self.journal_seq))
+        self.pending_entries += 1
+        if self.pending_entries >= self.checkpoint_interval:
+            self.checkpoint()
+
+    @profiled
+    def add_book(self, title, author, isbn, copies=1):
+        if copies < 1:
+            raise ValueError("A book needs at least one copy")
         book_id = len(self.books) + 1
-        book = Book(title, author, isbn, book_id)
+        book = Book(title, author, isbn, book_id, copies)
         self.books.append(book)
-        self.save()
+        self.books_by_id[book_id] = book
+        self.catalogue.add(book)
+        self.record('add_book', book=book.to_dict())
         return book
 
+    @profiled
     def add_member(self, name):
         member_id = len(self.members) + 1
         member = Member(name, member_id)
         self.members.append(member)
-        self.save()
+        self.record('add_member', member=member.to_dict())
         return member
 
+    @profiled
     def borrow_book(self, book_id, member_id, borrow_date):
-        if not any(b.book_id == book_id for b in self.books):
+        if book_id not in self.books_by_id:
             raise ValueError("Book ID does not exist")
-        if not any(m.member_id == member_id for m in self.members):
+        if not any(m.member_id == member_id for m in scanned('borrow_book', self.members)):
             raise ValueError("Member ID does not exist")
-        transaction_id = len(self.transactions) + 1
+        check_date(borrow_date)
+        if member_id not in self.ready_holds.get(book_id, ()) and self.available_copies(book_id) == 0:
+            raise ValueError("No copies available; place a hold instead")
+        transaction_id = self.next_transaction_id
+        self.next_transaction_id += 1
         transaction = Transaction(transaction_id, book_id, member_id, borrow_date)
         self.transactions.append(transaction)
-        self.save()
+        self.check_out(book_id, member_id)
+        self.record('borrow_book', transaction=transaction.to_dict())
         return transaction
 
+    @profiled
     def return_book(self, transaction_id, return_date):
-        transaction = next((t for t in self.transactions if t.transaction_id == transaction_id), None)
+        transaction = self.find_transaction(transaction_id, 'return_book')
         if not transaction:
             raise ValueError("Transaction ID does not exist")
+        if transaction.return_date is not None:
+            raise ValueError("Book has already been returned")
+        check_date(return_date)
         transaction.return_date = return_date
-        self.save()
+        self.check_in(transaction.book_id)
+        self.record('return_book', transaction_id=transaction_id, return_date=return_date)
         return transaction
 
+    def find_transaction(self, transaction_id, operation):
+        # A columnar store keeps IDs in order, so it is searched by bisection
+        if self.columnar:
+            return self.transactions.find(transaction_id)
+        return next((t for t in scanned(operation, self.transactions) if t.transaction_id == transaction_id), None)
+
+    def available_copies(self, book_id):
+        # Copies neither on loan nor set aside for a member with a hold
+        book = self.books_by_id[book_id]
+        return max(0, book.copies - self.loans_out.get(book_id, 0) - len(self.ready_holds.get(book_id, ())))
+
+    def check_out(self, book_id, member_id):
+        ready = self.ready_holds.get(book_id)
+        if ready and member_id in ready:
+            ready.remove(member_id)
+        self.loans_out[book_id] = self.loans_out.get(book_id, 0) + 1
+
+    def check_in(self, book_id):
+        self.loans_out[book_id] = max(0, self.loans_out.get(book_id, 0) - 1)
+        self.allocate(book_id)
+
+    def allocate(self, book_id):
+        # Sets free copies aside for the members at the front of the hold queue
+        queue = self.hold_queues.get(book_id)
+        while queue and self.available_copies(book_id):
+            priority, seq, member_id = heapq.heappop(queue)
+            if self.active_holds.get((book_id, member_id)) != (priority, seq):
+                continue
+            del self.active_holds[(book_id, member_id)]
+            self.ready_holds.setdefault(book_id, []).append(member_id)
+
+    def push_hold(self, book_id, member_id, priority, seq):
+        heapq.heappush(self.hold_queues.setdefault(book_id, []), (priority, seq, member_id))
+        self.active_holds[(book_id, member_id)] = (priority, seq)
+        self.hold_seq = max(self.hold_seq, seq)
+
+    def drop_hold(self, book_id, member_id):
+        ready = self.ready_holds.get(book_id)
+        if ready and member_id in ready:
+            # The copy set aside for this member goes to the next in line
+            ready.remove(member_id)
+            self.allocate(book_id)
+        elif self.active_holds.pop((book_id, member_id), None) is None:
+            raise ValueError("No hold found for this member and book")
+
+    def hold_status(self, book_id, member_id):
+        if member_id in self.ready_holds.get(book_id, ()):
+            return "ready"
+        if (book_id, member_id) in self.active_holds:
+            return "waiting"
+        return None
+
+    @profiled
+    def place_hold(self, book_id, member_id, priority=0):
+        if book_id not in self.books_by_id:
+            raise ValueError("Book ID does not exist")
+        if not any(m.member_id == member_id for m in scanned('place_hold', self.members)):
+            raise ValueError("Member ID does not exist")
+        if self.hold_status(book_id, member_id):
+            raise ValueError("Member already has a hold on this book")
+        self.push_hold(book_id, member_id, priority, self.hold_seq + 1)
+        self.allocate(book_id)
+        self.record('place_hold', book_id=book_id, member_id=member_id, priority=priority, seq=self.hold_seq)
+        return self.hold_status(book_id, member_id)
+
+    @profiled
+    def cancel_hold(self, book_id, member_id):
+        self.drop_hold(book_id, member_id)
+        self.record('cancel_hold', book_id=book_id, member_id=member_id)
+
+    @profiled
     def get_book_info(self, book_id):
-        book = next((b for b in self.books if b.book_id == book_id), None)
+        book = self.books_by_id.get(book_id)
         if not book:
             raise ValueError("Book not found")
-        return book.to_dict()
+        book_info = book.to_dict()
+        book_info['available'] = self.available_copies(book_id)
+        return book_info
+
+    @profiled
+    def search_books(self, query, limit=10):
+        return [self.books_by_id[book_id].to_dict() for book_id in self.catalogue.search(query, limit)]
+
+    def transaction_columns(self):
+        if self.columnar:
+            return self.transactions
+        return TransactionColumns.from_transactions(self.transactions)
+
+    @profiled
+    def overdue_loans(self, as_of, loan_days=LOAN_PERIOD_DAYS):
+        return self.transaction_columns().overdue(as_of, loan_days)
+
+    @profiled
+    def loans_per_member(self):
+        return self.with_archived_counts(self.transaction_columns().loans_per_member(), 'loans_per_member')
 
+    @profiled
+    def circulation_per_book(self):
+        return self.with_archived_counts(self.transaction_columns().circulation_per_book(), 'circulation_per_book')
+
+    @profiled
     def get_member_info(self, member_id):
-        member = next((m for m in self.members if m.member_id == member_id), None)
+        member = next((m for m in scanned('get_member_info', self.members) if m.member_id == member_id), None)
         if not member:
             raise ValueError("Member not found")
         return member.to_dict()
 
+    @profiled
     def get_transaction_info(self, transaction_id):
-        transaction = next((t for t in self.transactions if t.transaction_id == transaction_id), None)
+        transaction = self.find_transaction(transaction_id, 'get_transaction_info')
+        if not transaction:
+            transaction = self.find_archived(transaction_id)
         if not transaction:
             raise ValueError("Transaction not found")
         transaction_info = transaction.to_dict()
@@ -137,6 +946,19 @@ class LibraryManagementSystem:
         transaction_info['book'] = self.get_book_info(transaction.book_id)
         return transaction_info
 
+    @profiled
+    def member_history(self, member_id, since=None):
+        # All of a member's loans, oldest first. since ('YYYY-MM') skips archive
+        # shards for loans returned before that month.
+        history = {t.transaction_id: t.to_dict() for t in self.transactions if t.member_id == member_id}
+        for shard in self.archive_shards():
+            if since and shard['month'] < since:
+                continue
+            for record in load_archive_shard(shard['name']):
+                if record['member_id'] == member_id:
+                    history.setdefault(record['transaction_id'], dict(record))
+        return [history[transaction_id] for transaction_id in sorted(history)]
+
 # Menu-driven program
 def display_menu():
     print("\nLibrary Management System")
@@ -147,10 +969,31 @@ def display_menu():
     print("5. Get Book Info")
     print("6. Get Member Info")
     print("7. Get Transaction Info")
-    print("8. Exit")
+    print("8. Search Books")
+    print("9. Overdue Loans")
+    print("10. Member History")
+    print("11. Place Hold")
+    print("12. Cancel Hold")
+    print("13. Profiler")
+    print("14. Exit")
+
+def convert_main(args):
+    if not args or args[0] not in CODECS:
+        print(f"Usage: python Library.py convert CODEC [SOURCE [DESTINATION]]  (codecs: {', '.join(CODECS)})")
+        return
+    source = args[1] if len(args) > 1 else DATA_FILE
+    destination = args[2] if len(args) > 2 else source
+    before = os.path.getsize(source)
+    after = convert_data_file(args[0], source, destination)
+    print(f"Converted {source} ({before} bytes) to {args[0]} in {destination} ({after} bytes)")
 
 def main():
-    lms = LibraryManagementSystem()
+    if sys.argv[1:2] == ['convert']:
+        convert_main(sys.argv[2:])
+        return
+    if '--profile' in sys.argv[1:]:
+        enable_profiling()
+    lms = LibraryManagementSystem(journaled=True, archive_after_days=ARCHIVE_AFTER_DAYS)
     
     while True:
         display_menu()
@@ -160,8 +1003,12 @@ def main():
             title = input("Enter book title: ")
             author = input("Enter book author: ")
             isbn = input("Enter book ISBN: ")
-            book = lms.add_book(title, author, isbn)
-            print(f"Added book: {book.to_dict()}")
+            copies = input("Enter number of copies (default 1): ")
+            try:
+                book = lms.add_book(title, author, isbn, int(copies) if copies else 1)
+                print(f"Added book: {book.to_dict()}")
+            except ValueError as e:
+                print(e)
         
         elif choice == '2':
             name = input("Enter member name: ")
@@ -212,6 +1059,58 @@ def main():
                 print(e)
         
         elif choice == '8':
+            query = input("Enter title, author or ISBN: ")
+            for book_info in lms.search_books(query):
+                print(f"Book Info: {book_info}")
+        
+        elif choice == '9':
+            as_of = input("Enter date (YYYY-MM-DD): ")
+            try:
+                for transaction_id in lms.overdue_loans(as_of):
+                    print(f"Overdue: {lms.get_transaction_info(transaction_id)}")
+            except ValueError as e:
+                print(e)
+        
+        elif choice == '10':
+            member_id = int(input("Enter member ID: "))
+            since = input("Only loans returned since (YYYY-MM, blank for all): ")
+            for transaction_info in lms.member_history(member_id, since or None):
+                print(f"Loan: {transaction_info}")
+
+        elif choice == '11':
+            book_id = int(input("Enter book ID: "))
+            member_id = int(input("Enter member ID: "))
+            try:
+                status = lms.place_hold(book_id, member_id)
+                if status == "ready":
+                    print("A copy is available and has been set aside for this member.")
+                else:
+                    print("Hold placed; the next returned copy goes to the front of the queue.")
+            except ValueError as e:
+                print(e)
+
+        elif choice == '12':
+            book_id = int(input("Enter book ID: "))
+            member_id = int(input("Enter member ID: "))
+            try:
+                lms.cancel_hold(book_id, member_id)
+                print("Hold cancelled.")
+            except ValueError as e:
+                print(e)
+
+        elif choice == '13':
+            if PROFILER is None:
+                enable_profiling()
+                print("Profiling enabled. Choose Profiler again for a report.")
+            else:
+                print(PROFILER.report())
+                dump_profile()
+                print(f"Profile written to {PROFILE_FILE}")
+
+        elif choice == '14':
+            lms.checkpoint()
+            if PROFILER is not None:
+                dump_profile()
             print("Exiting the program.")
             break
         
@@ -1,22 +1,142 @@
+import csv
 import json
 import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
 
 # Data Storage
 DATA_FILE = 'school_data.json'
+DATA_DIR = 'school_data'
+LOCK_FILE = 'school_data.lock'
+VERSION_FILE = 'school_data.version'
+COLLECTIONS = ('students', 'teachers', 'classes')
+COMPACT_MIN_LINES = 1000
+IMPORT_BATCH_SIZE = 1000
+MAX_IMPORT_ERRORS = 1000
+
+# Each collection lives in its own upsert log under DATA_DIR. A line is
+# [position, record]: it replaces the record at that position in the collection,
+# or appends it when the position is one past the end. Saving appends lines for
+# the records that changed; compaction rewrites a log with one line per record.
+def collection_path(name):
+    return os.path.join(DATA_DIR, name + '.jsonl')
+
+def load_collection(name):
+    # Returns the records and the number of log lines they were read from
+    records = []
+    lines = 0
+    try:
+        f = open(collection_path(name), 'r')
+    except FileNotFoundError:
+        return records, lines
+    with f:
+        for line in f:
+            try:
+                position, record = json.loads(line)
+            except ValueError:
+                # A line torn by an interrupted write
+                continue
+            if position < len(records):
+                records[position] = record
+            else:
+                records.append(record)
+            lines += 1
+    return records, lines
 
-# Initialize data storage if it does not exist
-if not os.path.exists(DATA_FILE):
-    with open(DATA_FILE, 'w') as f:
-        json.dump({"students": [], "teachers": [], "classes": []}, f)
+def append_records(name, entries):
+    payload = ''.join(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries).encode()
+    with open(collection_path(name), 'a+b') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                # End a torn line first, so it is skipped on load instead of swallowing this write
+                payload = b'\n' + payload
+        f.write(payload)
 
-# Helper functions to load and save data
+def write_collection(name, records):
+    # Written to a temporary file and renamed, so readers in other processes
+    # never see a half-written log
+    tmp_file = collection_path(name) + '.tmp'
+    with open(tmp_file, 'w') as f:
+        for position, record in enumerate(records):
+            f.write(json.dumps([position, record], separators=(',', ':')) + '\n')
+    os.replace(tmp_file, collection_path(name))
+
+# Helper functions to load and save whole data sets
 def load_data():
-    with open(DATA_FILE, 'r') as f:
-        return json.load(f)
+    return {name: load_collection(name)[0] for name in COLLECTIONS}
 
 def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
+    os.makedirs(DATA_DIR, exist_ok=True)
+    for name in COLLECTIONS:
+        write_collection(name, data[name])
+
+# The version file is a small record of the store version and the version at
+# which each collection last changed, so other processes can tell cheaply
+# whether (and which part of) their in-memory state is stale
+def load_versions():
+    try:
+        with open(VERSION_FILE, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"version": 0, "collections": {name: 0 for name in COLLECTIONS}}
+
+def save_versions(versions):
+    tmp_file = VERSION_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(versions, f)
+    os.replace(tmp_file, VERSION_FILE)
+
+# Exclusive lock shared by every process working on the same data file
+@contextmanager
+def file_lock(path=LOCK_FILE):
+    with open(path, 'a+') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+# Initialize data storage if it does not exist, migrating a single-file
+# school_data.json from older versions (under the lock, so processes starting
+# together cannot clobber each other's first writes)
+with file_lock():
+    if not os.path.isdir(DATA_DIR):
+        if os.path.exists(DATA_FILE):
+            with open(DATA_FILE, 'r') as f:
+                save_data(json.load(f))
+            os.replace(DATA_FILE, DATA_FILE + '.migrated')
+        else:
+            save_data({"students": [], "teachers": [], "classes": []})
+
+# Streams import rows one at a time from a JSONL or CSV file. Every row names its
+# kind in a 'record' field: student, teacher, class or enrollment.
+def read_import_rows(path):
+    # JSONL lines are yielded unparsed, so a malformed line is reported as a
+    # row error by the importer instead of ending the import
+    if path.endswith('.jsonl'):
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield line
+    else:
+        with open(path, 'r', newline='') as f:
+            yield from csv.DictReader(f)
 
 # Student management
 class Student:
@@ -71,67 +191,221 @@ class SchoolClass:
 
 # Main School Management System
 class SchoolManagementSystem:
-    def __init__(self):
-        self.data = load_data()
-        self.students = [Student.from_dict(s) for s in self.data['students']]
-        self.teachers = [Teacher.from_dict(t) for t in self.data['teachers']]
-        self.classes = [SchoolClass.from_dict(c) for c in self.data['classes']]
+    # In shared mode several processes can work on the same data file: every
+    # mutation runs under the file lock on freshly refreshed state, so IDs are
+    # never handed out twice and no process overwrites another's changes
+    def __init__(self, shared=False):
+        self.shared = shared
+        # Positions of the records changed since the last save, per collection
+        self.dirty = {name: set() for name in COLLECTIONS}
+        self.log_lines = {}
+        with self.locked(refresh=False):
+            self.versions = load_versions()
+            for name in COLLECTIONS:
+                self.load_collection(name)
+
+    def load_collection(self, name):
+        records, self.log_lines[name] = load_collection(name)
+        if name == 'students':
+            self.students = [Student.from_dict(s) for s in records]
+        elif name == 'teachers':
+            self.teachers = [Teacher.from_dict(t) for t in records]
+        else:
+            self.classes = [SchoolClass.from_dict(c) for c in records]
+
+    @contextmanager
+    def locked(self, refresh=True):
+        if not self.shared:
+            yield
+            return
+        with file_lock():
+            if refresh:
+                self.refresh()
+            yield
+
+    def refresh(self):
+        # Reload only the collections another process has changed since we last looked
+        if not self.shared:
+            return
+        versions = load_versions()
+        if versions["version"] == self.versions["version"]:
+            return
+        for name in COLLECTIONS:
+            if versions["collections"][name] != self.versions["collections"][name]:
+                self.load_collection(name)
+        self.versions = versions
+
+    def mark(self, name, position):
+        self.dirty[name].add(position)
 
     def save(self):
-        self.data['students'] = [s.to_dict() for s in self.students]
-        self.data['teachers'] = [t.to_dict() for t in self.teachers]
-        self.data['classes'] = [c.to_dict() for c in self.classes]
-        save_data(self.data)
+        # Only records marked dirty are encoded and appended to their collection's
+        # log; a log that has grown to twice its record count is compacted instead
+        changed = [name for name in COLLECTIONS if self.dirty[name]]
+        for name in changed:
+            records = getattr(self, name)
+            positions = sorted(self.dirty[name])
+            if self.log_lines[name] + len(positions) > max(COMPACT_MIN_LINES, 2 * len(records)):
+                write_collection(name, [record.to_dict() for record in records])
+                self.log_lines[name] = len(records)
+            else:
+                append_records(name, [(position, records[position].to_dict()) for position in positions])
+                self.log_lines[name] += len(positions)
+            self.dirty[name].clear()
+        if changed:
+            self.versions["version"] += 1
+            for name in changed:
+                self.versions["collections"][name] = self.versions["version"]
+            save_versions(self.versions)
 
     def add_student(self, name, age):
-        student_id = len(self.students) + 1
-        student = Student(name, age, student_id)
-        self.students.append(student)
-        self.save()
+        with self.locked():
+            student_id = len(self.students) + 1
+            student = Student(name, age, student_id)
+            self.students.append(student)
+            self.mark('students', len(self.students) - 1)
+            self.save()
         return student
 
     def add_teacher(self, name, subject):
-        teacher_id = len(self.teachers) + 1
-        teacher = Teacher(name, subject, teacher_id)
-        self.teachers.append(teacher)
-        self.save()
+        with self.locked():
+            teacher_id = len(self.teachers) + 1
+            teacher = Teacher(name, subject, teacher_id)
+            self.teachers.append(teacher)
+            self.mark('teachers', len(self.teachers) - 1)
+            self.save()
         return teacher
 
     def create_class(self, class_name, teacher_id):
-        if not any(t.teacher_id == teacher_id for t in self.teachers):
-            raise ValueError("Teacher ID does not exist")
-        school_class = SchoolClass(class_name, teacher_id)
-        self.classes.append(school_class)
-        self.save()
+        with self.locked():
+            if not any(t.teacher_id == teacher_id for t in self.teachers):
+                raise ValueError("Teacher ID does not exist")
+            school_class = SchoolClass(class_name, teacher_id)
+            self.classes.append(school_class)
+            self.mark('classes', len(self.classes) - 1)
+            self.save()
         return school_class
 
     def assign_student_to_class(self, student_id, class_name):
-        if not any(s.student_id == student_id for s in self.students):
-            raise ValueError("Student ID does not exist")
-        school_class = next((c for c in self.classes if c.class_name == class_name), None)
-        if not school_class:
-            raise ValueError("Class does not exist")
-        school_class.add_student(student_id)
-        self.save()
+        with self.locked():
+            if not any(s.student_id == student_id for s in self.students):
+                raise ValueError("Student ID does not exist")
+            position = next((i for i, c in enumerate(self.classes) if c.class_name == class_name), None)
+            if position is None:
+                raise ValueError("Class does not exist")
+            self.classes[position].add_student(student_id)
+            self.mark('classes', position)
+            self.save()
+
+    def import_records(self, path, batch_size=IMPORT_BATCH_SIZE):
+        # In shared mode the lock is held for the whole import, so the lookup
+        # tables cannot go stale between batches
+        with self.locked():
+            return self.run_import(path, batch_size)
+
+    def run_import(self, path, batch_size):
+        # Foreign keys are checked against lookup tables built once up front, and
+        # the data file is written once per batch instead of once per row
+        student_ids = {s.student_id for s in self.students}
+        teacher_ids = {t.teacher_id for t in self.teachers}
+        class_positions = {}
+        for position, school_class in enumerate(self.classes):
+            class_positions.setdefault(school_class.class_name, position)
+        report = {"rows": 0, "imported": 0, "batches": 0, "error_count": 0, "errors": []}
+        pending = 0
+        start = time.perf_counter()
+        try:
+            for row_number, row in enumerate(read_import_rows(path), 1):
+                report["rows"] += 1
+                try:
+                    if isinstance(row, str):
+                        row = json.loads(row)
+                    if not isinstance(row, dict):
+                        raise ValueError("Row is not a JSON object")
+                    kind = row.get('record')
+                    if kind == 'student':
+                        student = Student(row['name'], int(row['age']), len(self.students) + 1)
+                        self.students.append(student)
+                        self.mark('students', len(self.students) - 1)
+                        student_ids.add(student.student_id)
+                    elif kind == 'teacher':
+                        teacher = Teacher(row['name'], row['subject'], len(self.teachers) + 1)
+                        self.teachers.append(teacher)
+                        self.mark('teachers', len(self.teachers) - 1)
+                        teacher_ids.add(teacher.teacher_id)
+                    elif kind == 'class':
+                        if int(row['teacher_id']) not in teacher_ids:
+                            raise ValueError("Teacher ID does not exist")
+                        school_class = SchoolClass(row['class_name'], int(row['teacher_id']))
+                        self.classes.append(school_class)
+                        self.mark('classes', len(self.classes) - 1)
+                        class_positions.setdefault(school_class.class_name, len(self.classes) - 1)
+                    elif kind == 'enrollment':
+                        if int(row['student_id']) not in student_ids:
+                            raise ValueError("Student ID does not exist")
+                        position = class_positions.get(row['class_name'])
+                        if position is None:
+                            raise ValueError("Class does not exist")
+                        self.classes[position].add_student(int(row['student_id']))
+                        self.mark('classes', position)
+                    else:
+                        raise ValueError(f"Unknown record type: {kind}")
+                except KeyError as e:
+                    self.record_import_error(report, row_number, f"Missing field {e}")
+                    continue
+                except (TypeError, ValueError) as e:
+                    self.record_import_error(report, row_number, str(e))
+                    continue
+                report["imported"] += 1
+                pending += 1
+                if pending >= batch_size:
+                    self.save()
+                    report["batches"] += 1
+                    pending = 0
+        finally:
+            # Rows already applied are saved even if reading the file fails part-way
+            if pending:
+                self.save()
+                report["batches"] += 1
+        report["seconds"] = time.perf_counter() - start
+        report["rows_per_second"] = report["rows"] / report["seconds"] if report["seconds"] else 0.0
+        return report
+
+    @staticmethod
+    def record_import_error(report, row_number, message):
+        report["error_count"] += 1
+        if len(report["errors"]) < MAX_IMPORT_ERRORS:
+            report["errors"].append({"row": row_number, "error": message})
 
     def get_student_info(self, student_id):
+        self.refresh()
         student = next((s for s in self.students if s.student_id == student_id), None)
         if not student:
             raise ValueError("Student not found")
         return student.to_dict()
 
     def get_teacher_info(self, teacher_id):
+        self.refresh()
         teacher = next((t for t in self.teachers if t.teacher_id == teacher_id), None)
         if not teacher:
             raise ValueError("Teacher not found")
         return teacher.to_dict()
 
     def get_class_info(self, class_name):
+        self.refresh()
         school_class = next((c for c in self.classes if c.class_name == class_name), None)
         if not school_class:
             raise ValueError("Class not found")
+        # One refresh for the whole roster, so every student comes from the same version
+        students_by_id = {s.student_id: s for s in self.students}
         class_info = school_class.to_dict()
-        class_info['students'] = [self.get_student_info(sid) for sid in class_info['students']]
+        students = []
+        for sid in class_info['students']:
+            student = students_by_id.get(sid)
+            if not student:
+                raise ValueError("Student not found")
+            students.append(student.to_dict())
+        class_info['students'] = students
         return class_info
 
 # Menu-driven program
@@ -144,10 +418,11 @@ def display_menu():
     print("5. Get Student Info")
     print("6. Get Teacher Info")
     print("7. Get Class Info")
-    print("8. Exit")
+    print("8. Import Records")
+    print("9. Exit")
 
 def main():
-    sms = SchoolManagementSystem()
+    sms = SchoolManagementSystem(shared=True)
     
     while True:
         display_menu()
@@ -208,6 +483,18 @@ def main():
                 print(e)
         
         elif choice == '8':
+            path = input("Enter CSV or JSONL file path: ")
+            batch_size = input(f"Enter batch size (default {IMPORT_BATCH_SIZE}): ")
+            try:
+                report = sms.import_records(path, int(batch_size) if batch_size else IMPORT_BATCH_SIZE)
+                print(f"Imported {report['imported']} of {report['rows']} rows in {report['seconds']:.2f}s "
+                      f"({report['rows_per_second']:.0f} rows/s, {report['batches']} batches)")
+                for error in report['errors']:
+                    print(f"Row {error['row']}: {error['error']}")
+            except (OSError, ValueError) as e:
+                print(e)
+        
+        elif choice == '9':
             print("Exiting the program.")
             break
         